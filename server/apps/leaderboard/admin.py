@@ -1,3 +1,9 @@
 from django.contrib import admin
+from .models import LeaderboardEntry
 
-# Register your models here.
+
+@admin.register(LeaderboardEntry)
+class LeaderboardEntryAdmin(admin.ModelAdmin):
+    list_display = ("rank", "username", "leetcode_username", "total_solved", "updated_at")
+    search_fields = ("username", "leetcode_username")
+    readonly_fields = [f.name for f in LeaderboardEntry._meta.fields]
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from apps.leaderboard.ranking import rebuild
+
+
+class Command(BaseCommand):
+    help = "Recompute every leaderboard rank from Profile solve counts"
+
+    def handle(self, *args, **kwargs):
+        n = rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Ranked {n} profiles"))
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.6 on 2026-10-18 17:16
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("users", "0002_profile_ranking_sync_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LeaderboardEntry",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("rank", models.PositiveIntegerField(db_index=True)),
+                ("username", models.CharField(max_length=150)),
+                ("leetcode_username", models.CharField(max_length=64)),
+                ("total_solved", models.PositiveIntegerField(default=0)),
+                ("easy_solved", models.PositiveIntegerField(default=0)),
+                ("medium_solved", models.PositiveIntegerField(default=0)),
+                ("hard_solved", models.PositiveIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("profile", models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name="leaderboard_entry", to="users.profile")),
+            ],
+            options={
+                "ordering": ["rank"],
+                "indexes": [models.Index(fields=["-total_solved", "-hard_solved", "-medium_solved", "profile"], name="leaderboard_sort_key")],
+            },
+        ),
+    ]
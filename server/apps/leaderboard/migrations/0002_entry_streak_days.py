@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2026-10-18 17:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("leaderboard", "0001_initial"),
+        ("users", "0002_profile_ranking_sync_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="leaderboardentry",
+            name="streak_days",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name="leaderboardentry",
+            index=models.Index(fields=["-streak_days", "profile"], name="leaderboard_streak_key"),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.6 on 2026-10-18 17:55
+
+from django.db import migrations, models
+
+
+def publish_runs(apps, schema_editor):
+    # streak_days held the streak as of the last ingest; store the run and its
+    # last day instead (see apps/problems/submissions.publish_streak)
+    CalendarSync = apps.get_model("problems", "CalendarSync")
+    Profile = apps.get_model("users", "Profile")
+    LeaderboardEntry = apps.get_model("leaderboard", "LeaderboardEntry")
+    for key, run_start, last_active in (
+        CalendarSync.objects.filter(last_active__isnull=False)
+        .values_list("leetcode_username", "run_start", "last_active")
+        .iterator()
+    ):
+        fields = {"streak_days": (last_active - run_start).days + 1, "streak_through": last_active}
+        Profile.objects.filter(leetcode_username__iexact=key).update(**fields)
+        LeaderboardEntry.objects.filter(leetcode_username__iexact=key).update(**fields)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("leaderboard", "0002_entry_streak_days"),
+        ("users", "0003_profile_streak_through"),
+        ("problems", "0003_calendar_streak_state"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="leaderboardentry",
+            name="leaderboard_streak_key",
+        ),
+        migrations.AddField(
+            model_name="leaderboardentry",
+            name="streak_through",
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="leaderboardentry",
+            index=models.Index(fields=["streak_through", "-streak_days", "profile"], name="leaderboard_streak_key"),
+        ),
+        migrations.RunPython(publish_runs, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.6 on 2026-10-18 18:07
+
+from django.db import migrations, models
+
+
+def create_lock_row(apps, schema_editor):
+    apps.get_model("leaderboard", "RankingLock").objects.get_or_create(pk=1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("leaderboard", "0003_entry_streak_through"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RankingLock",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+            ],
+            options={
+                "default_permissions": (),
+            },
+        ),
+        migrations.RunPython(create_lock_row, migrations.RunPython.noop),
+    ]
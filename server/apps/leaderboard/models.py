@@ -1,3 +1,68 @@
 from django.db import models
 
-# Create your models here.
+
+class LeaderboardEntry(models.Model):
+    """
+    Materialized leaderboard row, one per ranked Profile.
+
+    Rows are kept in rank order by apps/leaderboard/ranking.py whenever
+    profiles sync, so reads never sort Profile:
+      - page:        rank > cursor ORDER BY rank LIMIT n
+      - my rank:     entry by profile, then rank BETWEEN r-k AND r+k
+      - by streak:   runs ending today by (streak_days, profile) < cursor, via
+                     leaderboard_streak_key, then everyone else (streak 0) by profile
+
+    Ordering (best first): total_solved, hard_solved, medium_solved desc,
+    then profile id asc as the tie-breaker. Ranks are 1..N with no gaps.
+    """
+    profile = models.OneToOneField(
+        "users.Profile", on_delete=models.CASCADE, related_name="leaderboard_entry"
+    )
+    rank = models.PositiveIntegerField(db_index=True)
+
+    # denormalized from Profile/User so a page is a single index range scan
+    username = models.CharField(max_length=150)
+    leetcode_username = models.CharField(max_length=64)
+    total_solved = models.PositiveIntegerField(default=0)
+    easy_solved = models.PositiveIntegerField(default=0)
+    medium_solved = models.PositiveIntegerField(default=0)
+    hard_solved = models.PositiveIntegerField(default=0)
+    # latest run of active days and its last day; it is the current streak
+    # only while that day is today (see current_streak()), so nothing has to
+    # reset it at midnight
+    streak_days = models.PositiveIntegerField(default=0)
+    streak_through = models.DateField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["rank"]
+        indexes = [
+            models.Index(
+                fields=["-total_solved", "-hard_solved", "-medium_solved", "profile"],
+                name="leaderboard_sort_key",
+            ),
+            models.Index(fields=["streak_through", "-streak_days", "profile"],
+                         name="leaderboard_streak_key"),
+        ]
+
+    def __str__(self):
+        return f"#{self.rank} {self.username}"
+
+
+class RankingLock(models.Model):
+    """
+    Single row (pk=1) that apps/leaderboard/ranking.py locks around every
+    change to LeaderboardEntry.rank, so concurrent sync workers and
+    rebuild_leaderboard apply their shifts one at a time.
+    """
+
+    class Meta:
+        default_permissions = ()
+
+    def __str__(self):
+        return "leaderboard ranking lock"
+
+
+def current_streak(streak_days: int, streak_through, today) -> int:
+    """Stored run length if the run reaches `today`, else 0."""
+    return streak_days if streak_through == today else 0
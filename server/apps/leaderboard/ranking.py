@@ -0,0 +1,159 @@
+# apps/leaderboard/ranking.py
+#
+# Keeps LeaderboardEntry.rank in step with Profile solve counts.
+#
+# - rebuild():         full recompute (first run, or after bulk changes)
+# - place_profiles():  incremental, called by the sync worker after it saves
+#                      profiles. Each profile's new position is found with one
+#                      index lookup (the worst entry still ranked above it),
+#                      then only the ranks between its old and new position
+#                      are shifted by one in a single UPDATE.
+#
+# Both read ranks that other writers shift, so each transaction first locks
+# the RankingLock row: several `sync_leetcode --loop` workers, or a rebuild
+# during a sync, take turns instead of leaving duplicate or missing ranks.
+
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from apps.users.models import Profile
+from .models import LeaderboardEntry, RankingLock
+
+# best first; must match the order used by _better_than()
+ORDER = ("-total_solved", "-hard_solved", "-medium_solved", "profile_id")
+_WORST_FIRST = ("total_solved", "hard_solved", "medium_solved", "-profile_id")
+
+STAT_FIELDS = ["username", "leetcode_username", "total_solved", "easy_solved",
+               "medium_solved", "hard_solved", "streak_days", "streak_through", "updated_at"]
+
+
+def is_ranked(p: Profile) -> bool:
+    """Only profiles synced successfully from LeetCode appear on the board."""
+    return bool(p.leetcode_username) and p.last_sync_at is not None and p.ranking is not None
+
+
+def _lock_board() -> None:
+    """Serialize rank changes until the current transaction ends."""
+    RankingLock.objects.select_for_update().get_or_create(pk=1)
+
+
+def _better_than(total: int, hard: int, medium: int, profile_id: int) -> Q:
+    return (
+        Q(total_solved__gt=total)
+        | Q(total_solved=total, hard_solved__gt=hard)
+        | Q(total_solved=total, hard_solved=hard, medium_solved__gt=medium)
+        | Q(total_solved=total, hard_solved=hard, medium_solved=medium, profile_id__lt=profile_id)
+    )
+
+
+def _fill(entry: LeaderboardEntry, p: Profile, now) -> None:
+    entry.username = p.user.username
+    entry.leetcode_username = p.leetcode_username
+    entry.total_solved = p.total_solved
+    entry.easy_solved = p.easy_solved
+    entry.medium_solved = p.medium_solved
+    entry.hard_solved = p.hard_solved
+    entry.streak_days = p.streak_days
+    entry.streak_through = p.streak_through
+    entry.updated_at = now
+
+
+def rebuild() -> int:
+    """Recompute every rank from Profile. Returns the number of ranked profiles."""
+    profiles = (
+        Profile.objects
+        .exclude(leetcode_username__isnull=True)
+        .exclude(leetcode_username="")
+        .filter(last_sync_at__isnull=False, ranking__isnull=False)
+        .select_related("user")
+        .order_by("-total_solved", "-hard_solved", "-medium_solved", "pk")
+    )
+    now = timezone.now()
+    with transaction.atomic():
+        _lock_board()
+        existing = {e.profile_id: e for e in LeaderboardEntry.objects.all()}
+        to_create, to_update = [], []
+        rank = 0
+        for rank, p in enumerate(profiles.iterator(chunk_size=2000), start=1):
+            entry = existing.pop(p.pk, None)
+            if entry is None:
+                entry = LeaderboardEntry(profile_id=p.pk, rank=rank)
+                _fill(entry, p, now)
+                to_create.append(entry)
+            else:
+                entry.rank = rank
+                _fill(entry, p, now)
+                to_update.append(entry)
+
+        if existing:
+            LeaderboardEntry.objects.filter(pk__in=[e.pk for e in existing.values()]).delete()
+        LeaderboardEntry.objects.bulk_update(to_update, ["rank", *STAT_FIELDS], batch_size=1000)
+        LeaderboardEntry.objects.bulk_create(to_create, batch_size=1000)
+    return rank
+
+
+def _place(p: Profile, now) -> None:
+    # `p` was loaded before the upstream fetch; take the streak columns from
+    # the row itself so a submissions.publish_streak() in between isn't undone.
+    # Profile is locked before the entry, the same order publish_streak uses.
+    streak = (
+        Profile.objects.select_for_update()
+        .filter(pk=p.pk)
+        .values_list("streak_days", "streak_through")
+        .first()
+    )
+    if streak is None:  # deleted meanwhile (its entry went with it)
+        return
+    p.streak_days, p.streak_through = streak
+    entry = LeaderboardEntry.objects.select_for_update().filter(profile_id=p.pk).first()
+    old_rank = entry.rank if entry else None
+
+    if not is_ranked(p):
+        if entry:
+            entry.delete()
+            LeaderboardEntry.objects.filter(rank__gt=old_rank).update(rank=F("rank") - 1)
+        return
+
+    if entry and (entry.total_solved, entry.hard_solved, entry.medium_solved) == (
+        p.total_solved, p.hard_solved, p.medium_solved
+    ):
+        _fill(entry, p, now)  # position unchanged
+        entry.save(update_fields=STAT_FIELDS)
+        return
+
+    # rank of the worst entry that still beats p; "- 1" if p currently sits above it
+    above = (
+        LeaderboardEntry.objects
+        .filter(_better_than(p.total_solved, p.hard_solved, p.medium_solved, p.pk))
+        .exclude(profile_id=p.pk)
+        .order_by(*_WORST_FIRST)
+        .values_list("rank", flat=True)
+        .first()
+    )
+    if above is None:
+        new_rank = 1
+    else:
+        new_rank = above + 1 - (1 if old_rank is not None and above > old_rank else 0)
+
+    others = LeaderboardEntry.objects.exclude(profile_id=p.pk)
+    if old_rank is None:
+        others.filter(rank__gte=new_rank).update(rank=F("rank") + 1)
+        entry = LeaderboardEntry(profile_id=p.pk)
+    elif new_rank < old_rank:
+        others.filter(rank__gte=new_rank, rank__lt=old_rank).update(rank=F("rank") + 1)
+    elif new_rank > old_rank:
+        others.filter(rank__gt=old_rank, rank__lte=new_rank).update(rank=F("rank") - 1)
+
+    entry.rank = new_rank
+    _fill(entry, p, now)
+    entry.save()
+
+
+def place_profiles(profiles) -> None:
+    """Move each (already saved) profile to its new position on the board."""
+    now = timezone.now()
+    for p in profiles:
+        with transaction.atomic():
+            _lock_board()
+            _place(p, now)
@@ -1,3 +1,95 @@
+import random
+from datetime import timedelta
+
+from django.contrib.auth.models import User
 from django.test import TestCase
+from django.utils import timezone
+
+from apps.problems.submissions import publish_streak
+from apps.users.models import Profile
+from apps.users.sync import SYNC_FIELDS
+from . import ranking
+from .models import LeaderboardEntry
+
+
+class PlaceProfilesTests(TestCase):
+    """place_profiles() must leave the board exactly as rebuild() would."""
+
+    def setUp(self):
+        self.rng = random.Random(10)
+        self.profiles = [
+            Profile.objects.create(user=User.objects.create(username=f"user{i}"),
+                                   leetcode_username=f"lc{i}")
+            for i in range(12)
+        ]
+
+    def board(self):
+        return list(LeaderboardEntry.objects.order_by("rank")
+                    .values_list("rank", "profile_id", "total_solved", "hard_solved", "medium_solved"))
+
+    def assertMatchesRebuild(self):
+        placed = self.board()
+        self.assertEqual([row[0] for row in placed], list(range(1, len(placed) + 1)))
+        ranking.rebuild()
+        self.assertEqual(placed, self.board())
+
+    def update(self, p, synced=True):
+        # small ranges so ties (and the profile_id tie-break) come up often
+        p.easy_solved = self.rng.randint(0, 3)
+        p.medium_solved = self.rng.randint(0, 3)
+        p.hard_solved = self.rng.randint(0, 2)
+        p.total_solved = p.easy_solved + p.medium_solved + p.hard_solved
+        if synced:
+            p.ranking = self.rng.randint(1, 10 ** 6)
+            p.last_sync_at = timezone.now()
+        else:
+            p.ranking = None
+        p.save(update_fields=SYNC_FIELDS)  # what the sync worker writes
+        return p
+
+    def test_first_placement(self):
+        ranking.place_profiles([self.update(p) for p in self.profiles])
+        self.assertMatchesRebuild()
+
+    def test_unsynced_profiles_are_not_ranked(self):
+        ranking.place_profiles([self.update(p, synced=i % 3 != 0) for i, p in enumerate(self.profiles)])
+        self.assertEqual(LeaderboardEntry.objects.count(), 8)
+        self.assertMatchesRebuild()
+
+    def test_moves_up_and_down(self):
+        ranking.place_profiles([self.update(p) for p in self.profiles])
+        best = LeaderboardEntry.objects.get(rank=1).profile
+        worst = LeaderboardEntry.objects.order_by("-rank").first().profile
+        best.total_solved = best.easy_solved = best.medium_solved = best.hard_solved = 0
+        best.save()
+        worst.total_solved = worst.hard_solved = 100
+        worst.save()
+        ranking.place_profiles([best, worst])
+        self.assertEqual(LeaderboardEntry.objects.get(rank=1).profile_id, worst.pk)
+        self.assertMatchesRebuild()
+
+    def test_dropping_off_the_board(self):
+        ranking.place_profiles([self.update(p) for p in self.profiles])
+        gone = self.profiles[4]
+        gone.leetcode_username = ""
+        gone.save()
+        ranking.place_profiles([gone])
+        self.assertFalse(LeaderboardEntry.objects.filter(profile=gone).exists())
+        self.assertMatchesRebuild()
+
+    def test_random_syncs(self):
+        for _ in range(30):
+            batch = self.rng.sample(self.profiles, self.rng.randint(1, 4))
+            ranking.place_profiles([self.update(p, synced=self.rng.random() > 0.1) for p in batch])
+            self.assertMatchesRebuild()
 
-# Create your tests here.
+    def test_keeps_a_streak_published_during_the_fetch(self):
+        p = self.update(self.profiles[0])
+        ranking.place_profiles([p])
+        # the sync worker holds `p` from before its fetch; meanwhile the
+        # calendar is ingested and a new streak published
+        today = timezone.now().date()
+        publish_streak(p.leetcode_username, today - timedelta(days=2), today)
+        ranking.place_profiles([self.update(p)])
+        entry = LeaderboardEntry.objects.get(profile=p)
+        self.assertEqual((entry.streak_days, entry.streak_through), (3, today))
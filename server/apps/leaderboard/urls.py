@@ -0,0 +1,7 @@
+from django.urls import path
+from .views import LeaderboardAPIView, MyRankAPIView
+
+urlpatterns = [
+    path("", LeaderboardAPIView.as_view(), name="leaderboard"),
+    path("me/", MyRankAPIView.as_view(), name="leaderboard-me"),
+]
@@ -1,3 +1,111 @@
-from django.shortcuts import render
+from datetime import datetime, timezone
 
-# Create your views here.
+from django.db.models import Q
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .models import LeaderboardEntry, current_streak
+
+FIELDS = ("rank", "username", "leetcode_username", "total_solved",
+          "easy_solved", "medium_solved", "hard_solved", "streak_days", "streak_through")
+
+
+def _today():
+    return datetime.now(timezone.utc).date()
+
+
+def _out(rows: list, today) -> list:
+    """Rows as sent: streak_days is the current streak (0 once the run is over)."""
+    for r in rows:
+        r["streak_days"] = current_streak(r["streak_days"], r.pop("streak_through"), today)
+    return rows
+
+
+def _int_param(request, name, default, lo, hi):
+    try:
+        value = int(request.query_params.get(name, default))
+    except (TypeError, ValueError):
+        value = default
+    return max(lo, min(hi, value))
+
+
+class LeaderboardAPIView(APIView):
+    """
+    GET /api/leaderboard/?after=<rank>&limit=<n>
+    -> { results: [...], next: <rank to pass as ?after=> | null }
+
+    GET /api/leaderboard/?sort=streak&after=<streak>:<profile id>&limit=<n>
+    -> same, ordered by current streak (runs still going today, then everyone
+       else); `next` is a "<streak>:<profile id>" cursor
+
+    Keyset pagination on precomputed, indexed columns, so every page costs the same.
+    """
+    def get(self, request):
+        limit = _int_param(request, "limit", 50, 1, 100)
+        if request.query_params.get("sort") == "streak":
+            return self._by_streak(request, limit)
+
+        after = _int_param(request, "after", 0, 0, 2**31 - 1)
+        rows = list(
+            LeaderboardEntry.objects
+            .filter(rank__gt=after)
+            .order_by("rank")
+            .values(*FIELDS)[:limit + 1]
+        )
+        nxt = rows[limit - 1]["rank"] if len(rows) > limit else None
+        return Response({"results": _out(rows[:limit], _today()), "next": nxt})
+
+    def _by_streak(self, request, limit):
+        # current streaks (runs through today) by length, then everyone at 0 by profile
+        today = _today()
+        live = LeaderboardEntry.objects.filter(streak_through=today).order_by("-streak_days", "profile_id")
+        rest = LeaderboardEntry.objects.exclude(streak_through=today).order_by("profile_id")
+        after = request.query_params.get("after") or ""
+        streak, _, pid = after.partition(":")
+        if streak.isdigit() and pid.isdigit():
+            streak, pid = int(streak), int(pid)
+            if streak:
+                live = live.filter(Q(streak_days__lt=streak) | Q(streak_days=streak, profile_id__gt=pid))
+            else:
+                live = live.none()
+                rest = rest.filter(profile_id__gt=pid)
+
+        rows = list(live.values(*FIELDS, "profile_id")[:limit + 1])
+        if len(rows) <= limit:
+            rows += list(rest.values(*FIELDS, "profile_id")[:limit + 1 - len(rows)])
+        _out(rows, today)
+        nxt = None
+        if len(rows) > limit:
+            last = rows[limit - 1]
+            nxt = f"{last['streak_days']}:{last['profile_id']}"
+        for r in rows:
+            del r["profile_id"]
+        return Response({"results": rows[:limit], "next": nxt})
+
+
+class MyRankAPIView(APIView):
+    """
+    GET /api/leaderboard/me/?around=<k>
+    -> { me: {...} | null, neighbours: [k above, me, k below] }
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        around = _int_param(request, "around", 5, 0, 50)
+        me = (
+            LeaderboardEntry.objects
+            .filter(profile__user=request.user)
+            .values(*FIELDS)
+            .first()
+        )
+        if me is None:
+            return Response({"me": None, "neighbours": []})
+        neighbours = list(
+            LeaderboardEntry.objects
+            .filter(rank__gte=me["rank"] - around, rank__lte=me["rank"] + around)
+            .order_by("rank")
+            .values(*FIELDS)
+        )
+        today = _today()
+        return Response({"me": _out([me], today)[0], "neighbours": _out(neighbours, today)})
@@ -0,0 +1,94 @@
+# server/apps/problems/async_upstream.py
+#
+# Async counterpart of upstream.py for the ASGI views (apps/problems/async_views.py).
+#
+# One httpx.AsyncClient per event loop, so an ASGI worker keeps a single
+# keep-alive pool (LEETCODE_ASYNC_MAX_CONNECTIONS) however many requests are
+# waiting on LeetCode. Timeouts, retry count and backoff use the same settings
+# as the sync client; 429/5xx are retried here, connect errors by httpx.
+# Calls share the circuit breakers and rate budget in breaker.py.
+
+import asyncio
+import weakref
+
+import httpx
+from django.conf import settings
+
+from . import breaker
+from .upstream import backoff_max, base_url, graphql_url, leetcode_headers, timeout  # noqa: F401 (re-exported)
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+_clients = weakref.WeakKeyDictionary()  # event loop -> AsyncClient
+_gates = weakref.WeakKeyDictionary()    # event loop -> Semaphore
+
+
+def client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    c = _clients.get(loop)
+    if c is None:
+        connect, read = timeout()
+        c = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=getattr(settings, "LEETCODE_ASYNC_MAX_CONNECTIONS", 100),
+                max_keepalive_connections=getattr(settings, "LEETCODE_ASYNC_MAX_KEEPALIVE", 20),
+            ),
+            timeout=httpx.Timeout(read, connect=connect),
+            transport=httpx.AsyncHTTPTransport(retries=getattr(settings, "LEETCODE_HTTP_RETRIES", 2)),
+        )
+        _clients[loop] = c
+    return c
+
+
+def _retry_delay(resp: httpx.Response, attempt: int) -> float:
+    after = resp.headers.get("Retry-After")
+    if after and after.isdigit():
+        delay = float(after)
+    else:
+        delay = getattr(settings, "LEETCODE_HTTP_BACKOFF", 0.3) * (2 ** attempt)
+    return min(delay, backoff_max())
+
+
+def _gate() -> asyncio.Semaphore:
+    # Queue excess requests here rather than inside httpcore, whose pool
+    # rescans every waiting request on each state change (quadratic under load).
+    loop = asyncio.get_running_loop()
+    g = _gates.get(loop)
+    if g is None:
+        g = _gates[loop] = asyncio.Semaphore(getattr(settings, "LEETCODE_ASYNC_MAX_CONNECTIONS", 100))
+    return g
+
+
+async def request(method: str, url: str, **kwargs) -> httpx.Response:
+    # Like the sync client (whose retries happen inside urllib3), one call
+    # takes one rate token and gives the breaker one verdict, on the final
+    # response, however many attempts it made.
+    retries = getattr(settings, "LEETCODE_HTTP_RETRIES", 2)
+    circuit = breaker.acquire(breaker.endpoint_for(url))
+    try:
+        for attempt in range(retries + 1):
+            async with _gate():
+                resp = await client().request(method, url, **kwargs)
+            if resp.status_code not in RETRY_STATUSES or attempt == retries:
+                break
+            await resp.aclose()
+            await asyncio.sleep(_retry_delay(resp, attempt))
+    except httpx.TransportError:
+        circuit.record_failure()
+        raise
+    except BaseException:  # cancelled (calendar deadline) or a bug: no verdict
+        circuit.release()
+        raise
+    if breaker.is_failure_status(resp.status_code):
+        circuit.record_failure()
+    else:
+        circuit.record_success()
+    return resp
+
+
+async def get(url: str, **kwargs) -> httpx.Response:
+    return await request("GET", url, **kwargs)
+
+
+async def post(url: str, **kwargs) -> httpx.Response:
+    return await request("POST", url, **kwargs)
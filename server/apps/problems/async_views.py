@@ -0,0 +1,186 @@
+# server/apps/problems/async_views.py
+#
+# Async (ASGI) variants of leetcode_stats / leetcode_calendar.
+#
+# Same URLs, same responses, same cache/DB layers as views.py, but upstream
+# waits are awaited on the shared httpx pool (async_upstream.py) instead of
+# blocking a worker thread. Enabled with LEETCODE_ASYNC_VIEWS=True, which only
+# pays off when serving through config.asgi (e.g. uvicorn / gunicorn -k uvicorn).
+# ORM work is short and stays sync behind sync_to_async.
+
+import asyncio
+import time
+from datetime import date
+
+import httpx
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import JsonResponse
+from django.views.decorators.http import require_GET
+
+from apps.users import sync as profile_sync
+from . import async_upstream
+from . import cache as lc_cache
+from . import submissions
+from .breaker import UpstreamUnavailable
+from .conditional import conditional_response, not_modified
+from .singleflight import leetcode_async as inflight
+from .views import (
+    _CALENDAR_QUERY, _STATS_QUERY, _calendar_etag, _calendar_options, _calendar_payload,
+    _calendar_plan, _clean_calendar, _max_age, _parse_graphql_calendar, _parse_matched_user,
+    _parse_rest_calendar, _stats_response, _unavailable, _vary_accept, _window_start,
+)
+
+
+# =========================
+# LeetCode STATS
+# =========================
+
+@inflight.coalesce("stats")
+async def _fetch_leetcode_stats(username: str):
+    resp = await async_upstream.post(
+        async_upstream.graphql_url(),
+        json={"query": _STATS_QUERY, "variables": {"username": username}},
+        headers=async_upstream.leetcode_headers(username, json=True),
+    )
+    resp.raise_for_status()
+    return _parse_matched_user((resp.json().get("data") or {}).get("matchedUser"))
+
+@require_GET
+async def leetcode_stats(request, username: str):
+    """GET /api/problems/leetcode/<username>/ (async)"""
+    try:
+        profile = await sync_to_async(profile_sync.fresh_profile)(username)
+        if profile is not None:
+            return _stats_response(request, profile_sync.profile_stats(profile), profile.last_sync_at)
+
+        stats = await lc_cache.aget_or_fetch(
+            lc_cache.cache_key("stats", username),
+            lambda: _fetch_leetcode_stats(username),
+        )
+        if stats is None:
+            return JsonResponse({"error": "not_found"}, status=404)
+        return _stats_response(request, stats)
+
+    except UpstreamUnavailable as e:
+        profile = await sync_to_async(profile_sync.fresh_profile)(username, stale_ok=True)
+        if profile is not None:
+            return _stats_response(request, profile_sync.profile_stats(profile), profile.last_sync_at)
+        return _unavailable(e)
+    except httpx.HTTPStatusError as e:
+        return JsonResponse({"error": "stats_failed", "detail": f"http {e}"}, status=502)
+    except Exception as e:
+        return JsonResponse({"error": "stats_failed", "detail": str(e)}, status=502)
+
+
+# =========================
+# LeetCode CALENDAR
+# =========================
+
+@inflight.coalesce("calendar-graphql")
+async def _graphql_user_calendar(username: str, year: int) -> dict:
+    r = await async_upstream.post(
+        async_upstream.graphql_url(),
+        json={"query": _CALENDAR_QUERY, "variables": {"username": username, "year": year}},
+        headers=async_upstream.leetcode_headers(username, json=True),
+    )
+    r.raise_for_status()
+    return _parse_graphql_calendar(r.json())
+
+@inflight.coalesce("calendar-rest")
+async def _rest_user_calendar(username: str) -> dict:
+    headers = async_upstream.leetcode_headers(username)
+    u1 = f"{async_upstream.base_url()}/api/user_submission_calendars/{username}/"
+    r = await async_upstream.get(u1, headers=headers)
+    if r.is_success:
+        try:
+            return _parse_rest_calendar(r.json())
+        except Exception:
+            pass
+
+    u2 = f"{async_upstream.base_url()}/api/user_submission_calendar/"
+    r = await async_upstream.get(u2, params={"username": username}, headers=headers)
+    r.raise_for_status()
+    try:
+        return _parse_rest_calendar(r.json())
+    except Exception:
+        return {}
+
+async def _fetch_leetcode_calendar(username: str, years) -> tuple:
+    """Async views._fetch_leetcode_calendar: same merge, fallback and deadline rules."""
+    deadline = time.monotonic() + getattr(settings, "LEETCODE_CALENDAR_DEADLINE", 12)
+    graphql = [asyncio.ensure_future(_graphql_user_calendar(username, y)) for y in years]
+    rest = None
+    if getattr(settings, "LEETCODE_CALENDAR_SPECULATIVE_REST", False):
+        rest = asyncio.ensure_future(_rest_user_calendar(username))
+
+    combined = {}
+    refused = None
+    done, pending = await asyncio.wait(graphql, timeout=max(0, deadline - time.monotonic()))
+    complete = not pending
+    for t in pending:
+        t.cancel()
+    for t in done:
+        if t.exception() is None:
+            combined.update(t.result() or {})
+        else:
+            complete = False
+            if isinstance(t.exception(), UpstreamUnavailable):
+                refused = t.exception()
+
+    if combined or refused is not None:
+        if rest is not None:
+            rest.cancel()
+        if not combined:
+            raise refused
+    else:
+        if rest is None:
+            rest = asyncio.ensure_future(_rest_user_calendar(username))
+        try:
+            combined = await asyncio.wait_for(rest, timeout=max(0, deadline - time.monotonic()))
+        except UpstreamUnavailable:
+            raise
+        except Exception:
+            combined = {}
+
+    return _clean_calendar(combined), complete
+
+@inflight.coalesce("calendar-ingest")
+async def _refresh_calendar(username: str, start_year: int):
+    state, years = await sync_to_async(_calendar_plan)(username, start_year)
+    if not years:
+        return state
+    try:
+        raw, complete = await _fetch_leetcode_calendar(username, years)
+        tried = date(years[0], 1, 1)
+        return await sync_to_async(submissions.ingest)(username, raw, tried if complete else None, tried)
+    except Exception:
+        if state is None:
+            raise
+        return state
+
+@require_GET
+async def leetcode_calendar(request, username: str):
+    """GET /api/problems/leetcode/<username>/calendar/ (async)"""
+    days, encoding = _calendar_options(request)
+    try:
+        state = await _refresh_calendar(username, _window_start(days).year)
+        etag = _calendar_etag(username, state, days, encoding)
+        cached = not_modified(request, etag, state.fetched_at, _max_age())
+        if cached is not None:
+            return _vary_accept(cached)
+        payload = await sync_to_async(_calendar_payload)(username, state, days, encoding)
+        return _vary_accept(conditional_response(
+            request,
+            lambda: JsonResponse(payload, status=200),
+            etag=etag,
+            last_modified=state.fetched_at,
+            max_age=_max_age(),
+        ))
+
+    except UpstreamUnavailable as e:
+        return _unavailable(e)
+    except httpx.HTTPStatusError as e:
+        return JsonResponse({"error": "calendar_failed", "detail": f"http {e}"}, status=502)
+    except Exception as e:
+        return JsonResponse({"error": "calendar_failed", "detail": str(e)}, status=502)
@@ -0,0 +1,182 @@
+# server/apps/problems/breaker.py
+#
+# Outage protection for LeetCode calls (used by upstream.py / async_upstream.py).
+#
+# CircuitBreaker, one per upstream endpoint ("graphql", "rest"):
+#   closed    -> calls go through; failures are counted over a rolling window
+#   open      -> after LEETCODE_BREAKER_FAILURES failures within
+#                LEETCODE_BREAKER_WINDOW seconds, calls fail fast for
+#                LEETCODE_BREAKER_RESET seconds
+#   half-open -> then a single probe call is let through: success closes the
+#                circuit, failure opens it again
+#
+# TokenBucket: one global budget (LEETCODE_RATE_LIMIT calls/s, bursts up to
+# LEETCODE_RATE_BURST) for all outbound calls in this process.
+#
+# Both raise UpstreamUnavailable instead of waiting, so views can serve cached
+# data or answer 503 straight away.
+
+import threading
+import time
+from collections import deque
+
+from django.conf import settings
+
+
+class UpstreamUnavailable(Exception):
+    """LeetCode is not being called right now (circuit open or over budget)."""
+
+    def __init__(self, reason: str, retry_after: float = 1.0):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = max(1, int(retry_after + 0.999))
+
+
+class CircuitBreaker:
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, name: str, failures: int, window: float, reset: float):
+        self.name = name
+        self.max_failures = failures
+        self.window = window
+        self.reset = reset
+        self._lock = threading.Lock()
+        self._failures = deque()
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._probing = False
+
+    def before_call(self) -> None:
+        """Raise UpstreamUnavailable if the call must not go out."""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return
+            now = time.monotonic()
+            if self._state == self.OPEN:
+                wait = self._opened_at + self.reset - now
+                if wait > 0:
+                    raise UpstreamUnavailable(f"{self.name} circuit open", wait)
+                self._state = self.HALF_OPEN
+                self._probing = False
+            if self._probing:  # HALF_OPEN: one probe at a time
+                raise UpstreamUnavailable(f"{self.name} circuit half-open", 1)
+            self._probing = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = self.CLOSED
+            self._probing = False
+            self._failures.clear()
+
+    def record_failure(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if self._state == self.HALF_OPEN:
+                self._open(now)
+                return
+            self._failures.append(now)
+            while self._failures and self._failures[0] < now - self.window:
+                self._failures.popleft()
+            if len(self._failures) >= self.max_failures:
+                self._open(now)
+
+    def release(self) -> None:
+        """Call ended without a verdict (cancelled): free the half-open probe slot."""
+        with self._lock:
+            self._probing = False
+
+    def _open(self, now: float) -> None:
+        self._state = self.OPEN
+        self._opened_at = now
+        self._probing = False
+        self._failures.clear()
+
+    def status(self) -> dict:
+        with self._lock:
+            return {"state": self._state, "recent_failures": len(self._failures)}
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = burst
+        self._tokens = float(burst)
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def take(self) -> None:
+        """Consume one token or raise UpstreamUnavailable (never blocks)."""
+        if self.rate <= 0:  # disabled
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._stamp) * self.rate)
+            self._stamp = now
+            if self._tokens < 1:
+                raise UpstreamUnavailable("rate limited", (1 - self._tokens) / self.rate)
+            self._tokens -= 1
+
+
+_lock = threading.Lock()
+_breakers = {}
+_bucket = None
+
+
+def breaker(endpoint: str) -> CircuitBreaker:
+    b = _breakers.get(endpoint)
+    if b is None:
+        with _lock:
+            b = _breakers.get(endpoint)
+            if b is None:
+                b = _breakers[endpoint] = CircuitBreaker(
+                    endpoint,
+                    failures=getattr(settings, "LEETCODE_BREAKER_FAILURES", 5),
+                    window=getattr(settings, "LEETCODE_BREAKER_WINDOW", 30),
+                    reset=getattr(settings, "LEETCODE_BREAKER_RESET", 30),
+                )
+    return b
+
+
+def bucket() -> TokenBucket:
+    global _bucket
+    if _bucket is None:
+        with _lock:
+            if _bucket is None:
+                _bucket = TokenBucket(
+                    rate=getattr(settings, "LEETCODE_RATE_LIMIT", 20),
+                    burst=getattr(settings, "LEETCODE_RATE_BURST", 40),
+                )
+    return _bucket
+
+
+def endpoint_for(url: str) -> str:
+    return "graphql" if url.rstrip("/").endswith("/graphql") else "rest"
+
+
+def acquire(endpoint: str) -> CircuitBreaker:
+    """Gate one outbound call: circuit first (cheap), then the global budget."""
+    b = breaker(endpoint)
+    b.before_call()
+    try:
+        bucket().take()
+    except UpstreamUnavailable:
+        b.release()
+        raise
+    return b
+
+
+def is_failure_status(status: int) -> bool:
+    """Statuses that count against the circuit (after the client's own retries)."""
+    return status == 429 or status >= 500
+
+
+def status() -> dict:
+    return {name: b.status() for name, b in list(_breakers.items())}
+
+
+def reset() -> None:
+    """Forget all state (tests, or after settings change)."""
+    global _bucket
+    with _lock:
+        _breakers.clear()
+        _bucket = None
@@ -0,0 +1,138 @@
+# server/apps/problems/cache.py
+#
+# Small cache layer in front of the LeetCode upstream calls.
+#
+# Entries are stored in the Django cache named by settings.LEETCODE_CACHE_ALIAS
+# (locmem by default, but file/DB/redis backends work the same) as
+#   {"value": <payload or None>, "fetched_at": <unix ts>}
+#
+# - fresh   (age < ttl):              served straight from the cache
+# - stale   (ttl <= age < ttl+stale): served from the cache, refreshed in the background
+# - missing / expired:                fetched inline
+#
+# A fetch returning None means "not found" and is cached for the (shorter)
+# negative TTL so unknown usernames don't hit LeetCode on every page load.
+
+import asyncio
+import threading
+import time
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection
+
+MISSING = object()
+_tasks = set()  # strong refs to async background refreshes
+
+
+def _cache():
+    return caches[getattr(settings, "LEETCODE_CACHE_ALIAS", "default")]
+
+
+def cache_key(kind: str, username: str, *parts) -> str:
+    """lc:<kind>:<username>[:part...] — usernames are case-insensitive on LeetCode."""
+    bits = [kind, quote((username or "").strip().lower(), safe="")]
+    bits.extend(str(p) for p in parts)
+    return "lc:" + ":".join(bits)
+
+
+def _ttls():
+    return (
+        getattr(settings, "LEETCODE_CACHE_TTL", 300),
+        getattr(settings, "LEETCODE_CACHE_STALE_TTL", 3600),
+        getattr(settings, "LEETCODE_CACHE_NEGATIVE_TTL", 60),
+    )
+
+
+def store(key: str, value) -> None:
+    """Write a freshly fetched value (None = not found) into the cache."""
+    ttl, stale_ttl, negative_ttl = _ttls()
+    timeout = negative_ttl if value is None else ttl + stale_ttl
+    _cache().set(key, {"value": value, "fetched_at": time.time()}, timeout)
+
+
+def peek(key: str) -> tuple:
+    """(cached value, fresh?) regardless of age, or (MISSING, False)."""
+    entry = _cache().get(key)
+    if not entry:
+        return MISSING, False
+    ttl, _, _ = _ttls()
+    return entry.get("value"), time.time() - entry.get("fetched_at", 0) < ttl
+
+
+def invalidate(key: str) -> None:
+    _cache().delete(key)
+
+
+def _refresh_in_background(key: str, fetch) -> None:
+    # Only one refresher per key; the lock expires on its own if a thread dies.
+    if not _cache().add(f"{key}:refreshing", 1, timeout=30):
+        return
+
+    def run():
+        try:
+            store(key, fetch())
+        except Exception:
+            pass  # keep serving the stale copy; next request retries
+        finally:
+            _cache().delete(f"{key}:refreshing")
+            connection.close()  # DB-backed cache opens a connection on this thread
+
+    threading.Thread(target=run, name=f"lc-refresh:{key}", daemon=True).start()
+
+
+def get_or_fetch(key: str, fetch):
+    """
+    Return the cached value for `key`, calling `fetch()` on a miss.
+
+    `fetch` must return the payload to cache, or None for "not found";
+    exceptions propagate to the caller and nothing is cached.
+    """
+    ttl, _, _ = _ttls()
+    entry = _cache().get(key)
+    if entry:
+        age = time.time() - entry.get("fetched_at", 0)
+        value = entry.get("value")
+        if value is not None and age >= ttl:
+            _refresh_in_background(key, fetch)
+        return value
+
+    value = fetch()
+    store(key, value)
+    return value
+
+
+# ---- async twins (ASGI views); the Django cache API has a*/ methods for these ----
+
+async def astore(key: str, value) -> None:
+    ttl, stale_ttl, negative_ttl = _ttls()
+    timeout = negative_ttl if value is None else ttl + stale_ttl
+    await _cache().aset(key, {"value": value, "fetched_at": time.time()}, timeout)
+
+
+async def _arefresh(key: str, afetch) -> None:
+    try:
+        await astore(key, await afetch())
+    except Exception:
+        pass
+    finally:
+        await _cache().adelete(f"{key}:refreshing")
+
+
+async def aget_or_fetch(key: str, afetch):
+    """get_or_fetch() for coroutine fetchers; stale refreshes run as loop tasks."""
+    ttl, _, _ = _ttls()
+    entry = await _cache().aget(key)
+    if entry:
+        age = time.time() - entry.get("fetched_at", 0)
+        value = entry.get("value")
+        if value is not None and age >= ttl and await _cache().aadd(f"{key}:refreshing", 1, timeout=30):
+            task = asyncio.get_running_loop().create_task(_arefresh(key, afetch))
+            _tasks.add(task)
+            task.add_done_callback(_tasks.discard)
+        return value
+
+    value = await afetch()
+    await astore(key, value)
+    return value
@@ -0,0 +1,66 @@
+# server/apps/problems/conditional.py
+#
+# Conditional GET (ETag / Last-Modified / Cache-Control) for the read endpoints
+# here and in apps/roadmap.
+#
+# Validators are derived from data the view already has cheaply (the stats
+# dict, CalendarSync.fetched_at, Track.updated_at) *before* the body is built,
+# so a client sending a matching If-None-Match / If-Modified-Since gets a
+# bodiless 304 without any serialization.
+
+import hashlib
+import json
+
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+
+def make_etag(*parts) -> str:
+    """Strong ETag (quoted) from a hash of JSON-able parts."""
+    raw = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return '"%s"' % hashlib.blake2b(raw.encode(), digest_size=12).hexdigest()
+
+
+def content_etag(body: bytes) -> str:
+    """Strong ETag (quoted) for a rendered body."""
+    return '"%s"' % hashlib.blake2b(body, digest_size=12).hexdigest()
+
+
+def _ts(last_modified):
+    return int(last_modified.timestamp()) if last_modified else None
+
+
+def _add_headers(response, etag, ts, max_age) -> None:
+    if etag:
+        response["ETag"] = etag
+    if ts is not None:
+        response["Last-Modified"] = http_date(ts)
+    if max_age:
+        patch_cache_control(response, max_age=max_age)
+    else:
+        patch_cache_control(response, no_cache=True)
+
+
+def not_modified(request, etag=None, last_modified=None, max_age=0):
+    """The 304 (or 412) answer to a conditional request, or None to build the body."""
+    ts = _ts(last_modified)
+    response = get_conditional_response(request, etag=etag, last_modified=ts)
+    if response is not None and response.status_code == 304:
+        _add_headers(response, etag, ts, max_age)
+    return response
+
+
+def conditional_response(request, build, etag=None, last_modified=None, max_age=0):
+    """
+    not_modified() if the client's copy matches `etag` / `last_modified`
+    (a datetime), else `build()`. Successful responses get the validators and
+    Cache-Control: max_age=0 means "no-cache" (always revalidate; cheap
+    thanks to the 304).
+    """
+    response = not_modified(request, etag, last_modified, max_age)
+    if response is not None:
+        return response
+    response = build()
+    if 200 <= response.status_code < 300:
+        _add_headers(response, etag, _ts(last_modified), max_age)
+    return response
@@ -0,0 +1,60 @@
+# server/apps/problems/heatmap.py
+#
+# Compact encodings of a per-day count window (calendar endpoints).
+#
+# A window is `length` consecutive UTC days from `start`, held as one
+# array('H') (uint16, counts clamped to 65535) filled from the active days
+# only -- no per-day dicts. It is sent as one of:
+#
+#   list   [c0, c1, ...]                      one int per day
+#   rle    [c, n, c, n, ...]                  count c repeated n days
+#   b64    base64 of the little-endian uint16 buffer (2 bytes/day)
+#
+# Day i of the window is start + i days.
+
+import base64
+import sys
+from array import array
+
+ENCODINGS = ("list", "rle", "b64")
+MAX_COUNT = 0xFFFF
+
+
+def pack(active, start, length: int) -> array:
+    """array('H') of `length` days from `start`, given (date, count) pairs for active days."""
+    counts = array("H", bytes(2 * length))
+    for d, c in active:
+        i = (d - start).days
+        if 0 <= i < length:
+            counts[i] = min(int(c), MAX_COUNT)
+    return counts
+
+
+def rle(counts) -> list:
+    out = []
+    prev, run = None, 0
+    for c in counts:
+        if c == prev:
+            run += 1
+            continue
+        if run:
+            out += (prev, run)
+        prev, run = c, 1
+    if run:
+        out += (prev, run)
+    return out
+
+
+def b64(counts: array) -> str:
+    if sys.byteorder == "big":
+        counts = array("H", counts)
+        counts.byteswap()
+    return base64.b64encode(counts.tobytes()).decode("ascii")
+
+
+def encode(counts: array, encoding: str):
+    if encoding == "rle":
+        return rle(counts)
+    if encoding == "b64":
+        return b64(counts)
+    return counts.tolist()
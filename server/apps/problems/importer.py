@@ -0,0 +1,176 @@
+# server/apps/problems/importer.py
+#
+# Streaming import of a LeetCode problem catalogue into Problem
+# (used by `manage.py import_problems`).
+#
+# Input, read incrementally so memory stays flat however big the file is:
+#   - JSON array of objects     [{"titleSlug": ..., "title": ..., ...}, ...]
+#   - JSON lines                one object per line
+#   - CSV with a header row     slug,title,difficulty,tags,acceptance
+#
+# Field names follow LeetCode's problemset API, with plain aliases:
+#   slug        titleSlug | slug
+#   title       title
+#   difficulty  Easy/Medium/Hard, EASY/..., E/M/H or 1/2/3
+#   tags        topicTags ([{name, slug}] or [str]) | tags (list, or "a;b" / "a|b" in CSV)
+#   acceptance  acRate | acceptance   (percent; "52.3%" is accepted)
+#
+# Rows are upserted in chunks with one bulk_create(update_conflicts=True) per
+# chunk, keyed on slug (LeetCode's stable id: titles get renamed); existing
+# rows that have no slug yet are matched by title first.
+
+import csv
+import json
+
+from django.db import transaction
+from django.utils.text import slugify
+
+from .models import Problem
+
+UPDATE_FIELDS = ["title", "difficulty", "tags", "acceptance"]
+_DIFFICULTY = {"e": "E", "m": "M", "h": "H", "1": "E", "2": "M", "3": "H"}
+
+
+def iter_json_array(f, block: int = 1 << 16):
+    """Yield the elements of a top-level JSON array without loading it whole."""
+    decoder = json.JSONDecoder()
+    buf = ""
+    pos = 0
+    started = False
+    eof = False
+    while True:
+        # skip whitespace / separators
+        while pos < len(buf) and buf[pos] in " \t\r\n,":
+            pos += 1
+        if pos < len(buf) and not started:
+            if buf[pos] != "[":
+                raise ValueError("expected a JSON array")
+            started = True
+            pos += 1
+            continue
+        if pos < len(buf) and buf[pos] == "]":
+            return
+        if pos < len(buf):
+            try:
+                obj, end = decoder.raw_decode(buf, pos)
+            except ValueError:
+                if eof:
+                    raise
+            else:
+                yield obj
+                pos = end
+                continue
+        elif eof:
+            raise ValueError("unterminated JSON array")
+        chunk = f.read(block)
+        eof = not chunk
+        buf = buf[pos:] + chunk
+        pos = 0
+
+
+def iter_json_lines(f):
+    for line in f:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def iter_records(f, fmt: str):
+    if fmt == "csv":
+        return csv.DictReader(f)
+    if fmt == "jsonl":
+        return iter_json_lines(f)
+    return iter_json_array(f)
+
+
+def detect_format(path: str) -> str:
+    lower = path.lower()
+    if lower.endswith(".csv"):
+        return "csv"
+    if lower.endswith((".jsonl", ".ndjson")):
+        return "jsonl"
+    return "json"
+
+
+def _tags(raw) -> list:
+    if not raw:
+        return []
+    if isinstance(raw, str):
+        raw = raw.replace("|", ";").split(";")
+    out = []
+    for t in raw:
+        if isinstance(t, dict):
+            t = t.get("slug") or slugify(t.get("name") or "")
+        t = str(t).strip()
+        if t:
+            out.append(t)
+    return out
+
+
+def _acceptance(raw):
+    if raw in (None, ""):
+        return None
+    return round(float(str(raw).rstrip("%")), 2)
+
+
+def to_problem(rec: dict):
+    """Problem (unsaved) for one record, or None if it has no title."""
+    title = (rec.get("title") or "").strip()
+    if not title:
+        return None
+    slug = (rec.get("titleSlug") or rec.get("slug") or "").strip() or slugify(title)
+    difficulty = _DIFFICULTY.get(str(rec.get("difficulty") or "E").strip()[:1].lower(), "E")
+    return Problem(
+        title=title[:200],
+        slug=slug[:200],
+        difficulty=difficulty,
+        tags=_tags(rec.get("topicTags") if "topicTags" in rec else rec.get("tags")),
+        acceptance=_acceptance(rec.get("acRate") if "acRate" in rec else rec.get("acceptance")),
+    )
+
+
+def upsert(problems: list) -> None:
+    """
+    Write one chunk, keyed on slug (LeetCode's stable id, so renamed titles
+    are followed). Existing rows without a slug (added by hand / before slugs
+    were imported) are first given theirs by title.
+    """
+    slugs = {p.title: p.slug for p in problems}
+    with transaction.atomic():
+        legacy = list(Problem.objects.filter(slug__isnull=True, title__in=list(slugs)).only("pk", "title"))
+        for row in legacy:
+            row.slug = slugs[row.title]
+        Problem.objects.bulk_update(legacy, ["slug"], batch_size=500)
+        Problem.objects.bulk_create(
+            problems,
+            update_conflicts=True,
+            unique_fields=["slug"],
+            update_fields=UPDATE_FIELDS,
+        )
+
+
+def import_records(records, chunk_size: int = 1000, on_chunk=None) -> dict:
+    """
+    Upsert records chunk by chunk. Duplicate slugs within a chunk keep the
+    last one. Returns {"rows": upserted, "skipped": records without a title}.
+    """
+    rows = skipped = 0
+    chunk = {}
+    for rec in records:
+        p = to_problem(rec)
+        if p is None:
+            skipped += 1
+            continue
+        chunk[p.slug] = p
+        if len(chunk) >= chunk_size:
+            upsert(list(chunk.values()))
+            rows += len(chunk)
+            chunk = {}
+            if on_chunk:
+                on_chunk(rows)
+    if chunk:
+        upsert(list(chunk.values()))
+        rows += len(chunk)
+        if on_chunk:
+            on_chunk(rows)
+    return {"rows": rows, "skipped": skipped}
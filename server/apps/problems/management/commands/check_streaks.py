@@ -0,0 +1,46 @@
+from itertools import groupby
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.problems.models import CalendarSync, SubmissionDay
+from apps.problems.streaks import advance
+from apps.problems.submissions import publish_streak
+
+
+class Command(BaseCommand):
+    help = "Recompute streak aggregates from SubmissionDay and report (or --fix) mismatches"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--fix", action="store_true",
+                            help="write recomputed aggregates and refresh Profile.streak_days")
+
+    def handle(self, *args, **opts):
+        expected = {}
+        rows = (
+            SubmissionDay.objects
+            .filter(count__gt=0)
+            .order_by("leetcode_username", "date")
+            .values_list("leetcode_username", "date")
+        )
+        for key, group in groupby(rows.iterator(chunk_size=5000), key=lambda r: r[0]):
+            expected[key] = advance(None, None, 0, (d for _, d in group))
+
+        checked = bad = 0
+        for state in CalendarSync.objects.iterator():
+            checked += 1
+            want = expected.get(state.leetcode_username, (None, None, 0))
+            have = (state.run_start, state.last_active, state.max_run)
+            if have != want:
+                bad += 1
+                self.stdout.write(f"{state.leetcode_username}: stored {have}, expected {want}")
+            if opts["fix"]:
+                with transaction.atomic():
+                    if have != want:
+                        state.run_start, state.last_active, state.max_run = want
+                        state.save(update_fields=["run_start", "last_active", "max_run"])
+                    publish_streak(state.leetcode_username, want[0], want[1])
+
+        style = self.style.SUCCESS if not bad else self.style.WARNING
+        self.stdout.write(style(f"Checked {checked} users, {bad} mismatched"
+                                + (" (fixed)" if bad and opts["fix"] else "")))
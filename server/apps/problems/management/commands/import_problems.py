@@ -0,0 +1,52 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError
+
+from apps.problems import importer, search
+from apps.roadmap import catalogue
+
+
+class Command(BaseCommand):
+    help = ("Import a LeetCode problem catalogue (JSON array, JSON lines or CSV) "
+            "into Problem, upserting by slug in chunks")
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="catalogue file")
+        parser.add_argument("--format", choices=["auto", "json", "jsonl", "csv"], default="auto")
+        parser.add_argument("--chunk-size", type=int, default=1000,
+                            help="rows per bulk upsert")
+
+    def handle(self, *args, **opts):
+        fmt = opts["format"]
+        if fmt == "auto":
+            fmt = importer.detect_format(opts["path"])
+        started = time.monotonic()
+
+        def progress(rows):
+            if opts["verbosity"] > 1:
+                elapsed = time.monotonic() - started
+                self.stdout.write(f"{rows} rows ({rows / max(elapsed, 1e-9):.0f} rows/s)")
+
+        try:
+            with open(opts["path"], encoding="utf-8-sig", newline="") as f:
+                res = importer.import_records(
+                    importer.iter_records(f, fmt), max(1, opts["chunk_size"]), progress
+                )
+        except (OSError, ValueError) as e:
+            raise CommandError(f"import failed: {e}")
+        except IntegrityError as e:
+            # e.g. two problems swapping titles; earlier chunks stay committed
+            catalogue.bump()
+            search.invalidate()
+            raise CommandError(f"import stopped on a conflicting row: {e}")
+
+        # bulk upserts send no signals: refresh the pre-rendered track JSON
+        # and the search index
+        catalogue.bump()
+        search.invalidate()
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {res['rows']} problems in {elapsed:.2f}s "
+            f"({res['rows'] / max(elapsed, 1e-9):.0f} rows/s, skipped {res['skipped']})"
+        ))
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.6 on 2026-10-18 17:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("problems", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CalendarSync",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("leetcode_username", models.CharField(max_length=64, unique=True)),
+                ("last_day", models.DateField(blank=True, null=True)),
+                ("fetched_at", models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="SubmissionDay",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("leetcode_username", models.CharField(max_length=64)),
+                ("date", models.DateField()),
+                ("count", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "constraints": [models.UniqueConstraint(fields=("leetcode_username", "date"), name="uniq_submission_day")],
+            },
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.6 on 2026-10-18 17:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("problems", "0002_submission_calendar"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="calendarsync",
+            name="last_active",
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="calendarsync",
+            name="max_run",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="calendarsync",
+            name="run_start",
+            field=models.DateField(blank=True, null=True),
+        ),
+    ]
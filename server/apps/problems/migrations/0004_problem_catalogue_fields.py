@@ -0,0 +1,28 @@
+# Generated by Django 5.2.6 on 2026-10-18 17:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("problems", "0003_calendar_streak_state"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="problem",
+            name="acceptance",
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="problem",
+            name="slug",
+            field=models.SlugField(blank=True, max_length=200, null=True, unique=True),
+        ),
+        migrations.AddField(
+            model_name="problem",
+            name="tags",
+            field=models.JSONField(blank=True, default=list),
+        ),
+    ]
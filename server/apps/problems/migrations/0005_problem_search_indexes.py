@@ -0,0 +1,36 @@
+# PostgreSQL-only indexes for PROBLEM_SEARCH_BACKEND="db" (apps/problems/search.py):
+# trigram GIN on UPPER(title) serves icontains/istartswith, GIN on tags serves
+# tags @> '["..."]'. Other databases use the in-process index and skip this.
+
+from django.db import migrations
+
+FORWARD = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS problem_title_trgm ON problems_problem "
+    "USING gin (UPPER(title) gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS problem_tags_gin ON problems_problem USING gin (tags)",
+]
+BACKWARD = [
+    "DROP INDEX IF EXISTS problem_tags_gin",
+    "DROP INDEX IF EXISTS problem_title_trgm",
+]
+
+
+def _run(statements):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != "postgresql":
+            return
+        for sql in statements:
+            schema_editor.execute(sql)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("problems", "0004_problem_catalogue_fields"),
+    ]
+
+    operations = [
+        migrations.RunPython(_run(FORWARD), _run(BACKWARD)),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-18 17:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("problems", "0005_problem_search_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="calendarsync",
+            name="first_day",
+            field=models.DateField(blank=True, null=True),
+        ),
+    ]
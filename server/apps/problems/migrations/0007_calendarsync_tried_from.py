@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-18 18:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("problems", "0006_calendarsync_first_day"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="calendarsync",
+            name="tried_from",
+            field=models.DateField(blank=True, null=True),
+        ),
+    ]
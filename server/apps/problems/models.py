@@ -4,6 +4,60 @@ class Problem(models.Model):
     DIFFICULTY = (("E","Easy"),("M","Medium"),("H","Hard"))
     title = models.CharField(max_length=200, unique=True)
     difficulty = models.CharField(max_length=1, choices=DIFFICULTY, default="E")
+    # LeetCode catalogue fields, filled by `manage.py import_problems`
+    slug = models.SlugField(max_length=200, unique=True, null=True, blank=True)
+    tags = models.JSONField(default=list, blank=True)            # ["array", "hash-table"]
+    acceptance = models.FloatField(null=True, blank=True)        # acceptance rate, percent
 
     def __str__(self):
         return self.title
+
+
+class SubmissionDay(models.Model):
+    """
+    Accepted-submission count for one LeetCode user on one UTC day.
+
+    Filled from LeetCode's submissionCalendar by apps/problems/submissions.py;
+    `leetcode_username` is stored lowercased (LeetCode names are case-insensitive).
+    The unique (user, date) index doubles as the range-scan index for reads.
+    """
+    leetcode_username = models.CharField(max_length=64)
+    date = models.DateField()
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["leetcode_username", "date"], name="uniq_submission_day"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.leetcode_username} {self.date}: {self.count}"
+
+
+class CalendarSync(models.Model):
+    """
+    Per LeetCode user: ingestion bookmarks (newest day stored, oldest year
+    covered, last fetch) and streak aggregates maintained on ingest
+    (apps/problems/streaks.advance), so streak reads never touch
+    SubmissionDay. `manage.py check_streaks` rebuilds the aggregates from
+    SubmissionDay.
+    """
+    leetcode_username = models.CharField(max_length=64, unique=True)
+    last_day = models.DateField(null=True, blank=True)
+    fetched_at = models.DateTimeField(null=True, blank=True)
+    # Jan 1 of the oldest year fetched completely (with every later year);
+    # older years are fetched when a longer calendar window asks for them
+    first_day = models.DateField(null=True, blank=True)
+    # Jan 1 of the oldest year the latest fetch asked for; years from here on
+    # aren't retried until the stored days go stale
+    tried_from = models.DateField(null=True, blank=True)
+
+    # latest run of consecutive active days, and the longest run ever seen
+    run_start = models.DateField(null=True, blank=True)
+    last_active = models.DateField(null=True, blank=True)
+    max_run = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.leetcode_username} @ {self.last_day}"
@@ -0,0 +1,227 @@
+# server/apps/problems/search.py
+#
+# Problem search (GET /api/problems/search/) over an in-process index.
+#
+# The index holds every Problem as a small tuple plus:
+#   - trigrams  lowercased title trigram -> problem ids (substring queries, 3+ chars)
+#   - words     sorted (title word, id) pairs       (prefix queries, 1-2 chars)
+# A query intersects the posting sets, verifies the substring, applies the
+# difficulty / tag filters and pages by id (keyset: ?after=<last id>).
+#
+# Freshness: signals.py applies Problem saves/deletes to this process's index
+# and bumps a version in the PROBLEM_SEARCH_CACHE_ALIAS cache; other processes
+# read that version at most every PROBLEM_SEARCH_RECHECK seconds (it is a
+# network hop with a shared backend) and rebuild when it moved (bulk writes
+# such as import_problems only bump). The index is also rebuilt after
+# PROBLEM_SEARCH_MAX_AGE seconds as a backstop for unshared caches.
+#
+# PROBLEM_SEARCH_BACKEND="db" skips the index and queries the database instead;
+# on PostgreSQL migration 0005 adds trigram / GIN indexes for that.
+
+import threading
+import time
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict, namedtuple
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection, transaction
+
+from .models import Problem
+
+FIELDS = ("id", "title", "slug", "difficulty", "tags", "acceptance")
+Row = namedtuple("Row", FIELDS)
+
+VERSION_KEY = "problems:search:version"
+
+
+def _trigrams(text: str) -> set:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _words(text: str) -> set:
+    return {w for w in "".join(c if c.isalnum() else " " for c in text).split() if w}
+
+
+class ProblemIndex:
+    def __init__(self, rows=(), version=None):
+        self.version = version
+        self.built_at = time.monotonic()
+        self.rows = {}
+        self.ids = []                       # sorted
+        self.trigrams = defaultdict(set)
+        self.words = []                     # sorted (word, id)
+        for row in sorted(rows):
+            self._add(row, append=True)
+        self.words.sort()
+
+    def _add(self, row: Row, append: bool = False) -> None:
+        self.rows[row.id] = row
+        if append:
+            self.ids.append(row.id)
+        else:
+            insort(self.ids, row.id)
+        title = row.title.lower()
+        for t in _trigrams(title):
+            self.trigrams[t].add(row.id)
+        for w in _words(title):
+            if append:
+                self.words.append((w, row.id))
+            else:
+                insort(self.words, (w, row.id))
+
+    def remove(self, pk: int) -> None:
+        row = self.rows.pop(pk, None)
+        if row is None:
+            return
+        self.ids.pop(bisect_left(self.ids, pk))
+        title = row.title.lower()
+        for t in _trigrams(title):
+            self.trigrams[t].discard(pk)
+        for w in _words(title):
+            i = bisect_left(self.words, (w, pk))
+            if i < len(self.words) and self.words[i] == (w, pk):
+                self.words.pop(i)
+
+    def upsert(self, row: Row) -> None:
+        self.remove(row.id)
+        self._add(row)
+
+    def _candidates(self, q: str):
+        """Matching ids (unsorted set), or None for "everything"."""
+        if not q:
+            return None
+        if len(q) >= 3:
+            postings = sorted((self.trigrams.get(t, ()) for t in _trigrams(q)), key=len)
+            found = set(postings[0]).intersection(*postings[1:])
+            return {pk for pk in found if q in self.rows[pk].title.lower()}
+        lo = bisect_left(self.words, (q,))
+        found = set()
+        for w, pk in self.words[lo:]:
+            if not w.startswith(q):
+                break
+            found.add(pk)
+        return found
+
+    def search(self, q="", difficulties=(), tags=(), after=0, limit=20) -> list:
+        found = self._candidates(q.strip().lower())
+        ids = self.ids if found is None else sorted(found)
+        out = []
+        for pk in ids[bisect_right(ids, after):]:
+            row = self.rows[pk]
+            if difficulties and row.difficulty not in difficulties:
+                continue
+            if tags and not all(t in row.tags for t in tags):
+                continue
+            out.append(row)
+            if len(out) == limit:
+                break
+        return out
+
+
+_lock = threading.RLock()
+_index = None
+_checked_at = 0.0
+
+
+def _cache():
+    return caches[getattr(settings, "PROBLEM_SEARCH_CACHE_ALIAS", "default")]
+
+
+def _version():
+    return _cache().get(VERSION_KEY, 0)
+
+
+def _load(version) -> ProblemIndex:
+    rows = (Row(*r) for r in Problem.objects.values_list(*FIELDS).iterator(chunk_size=2000))
+    return ProblemIndex(rows, version)
+
+
+def index() -> ProblemIndex:
+    """The current process's index, (re)built if missing, outdated or too old."""
+    global _index, _checked_at
+    now = time.monotonic()
+    version = None
+    if _index is None or now - _checked_at >= getattr(settings, "PROBLEM_SEARCH_RECHECK", 5):
+        version = _version()
+        _checked_at = now
+    max_age = getattr(settings, "PROBLEM_SEARCH_MAX_AGE", 300)
+    with _lock:
+        idx = _index
+        if (idx is None or (version is not None and idx.version != version)
+                or now - idx.built_at > max_age):
+            idx = _index = _load(_version() if version is None else version)
+        return idx
+
+
+def _bump(applied: bool) -> None:
+    # incr() is atomic on shared backends; a process whose index already has
+    # this change moves along with the version instead of rebuilding
+    global _index
+    cache = _cache()
+    if cache.add(VERSION_KEY, 1, timeout=None):
+        new = 1
+    else:
+        try:
+            new = cache.incr(VERSION_KEY)
+        except ValueError:
+            new = None
+    with _lock:
+        if _index is not None:
+            if applied and new is not None and _index.version == new - 1:
+                _index.version = new
+            else:
+                _index = None
+
+
+def invalidate() -> None:
+    """Rebuild every process's index on its next query (after bulk writes)."""
+    transaction.on_commit(lambda: _bump(applied=False))
+
+
+def problem_saved(problem: Problem) -> None:
+    row = Row(*(getattr(problem, f) for f in FIELDS))
+
+    def apply():
+        with _lock:
+            if _index is not None:
+                _index.upsert(row)
+        _bump(applied=True)
+
+    transaction.on_commit(apply)
+
+
+def problem_deleted(pk: int) -> None:
+    def apply():
+        with _lock:
+            if _index is not None:
+                _index.remove(pk)
+        _bump(applied=True)
+
+    transaction.on_commit(apply)
+
+
+def _search_db(q, difficulties, tags, after, limit) -> list:
+    qs = Problem.objects.filter(pk__gt=after)
+    q = q.strip()
+    if len(q) >= 3:
+        qs = qs.filter(title__icontains=q)
+    elif q:
+        qs = qs.filter(title__istartswith=q)
+    if difficulties:
+        qs = qs.filter(difficulty__in=difficulties)
+    for t in tags:
+        if connection.vendor == "postgresql":
+            qs = qs.filter(tags__contains=[t])
+        else:
+            qs = qs.filter(tags__icontains=f'"{t}"')
+    return [Row(*r) for r in qs.order_by("id").values_list(*FIELDS)[:limit]]
+
+
+def search(q="", difficulties=(), tags=(), after=0, limit=20) -> list:
+    """Rows matching the query, ordered by id, strictly after `after`."""
+    if getattr(settings, "PROBLEM_SEARCH_BACKEND", "memory") == "db":
+        return _search_db(q, difficulties, tags, after, limit)
+    idx = index()
+    with _lock:
+        return idx.search(q, difficulties, tags, after, limit)
@@ -0,0 +1,21 @@
+# server/apps/problems/signals.py
+#
+# Keep the in-process problem search index (search.py) in step with Problem
+# writes. Bulk writes (bulk_create / update) send no signals; callers such as
+# import_problems call search.invalidate() themselves.
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import search
+from .models import Problem
+
+
+@receiver(post_save, sender=Problem)
+def problem_saved(sender, instance, **kwargs):
+    search.problem_saved(instance)
+
+
+@receiver(post_delete, sender=Problem)
+def problem_deleted(sender, instance, **kwargs):
+    search.problem_deleted(instance.pk)
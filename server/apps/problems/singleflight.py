@@ -0,0 +1,139 @@
+# server/apps/problems/singleflight.py
+#
+# Request coalescing for upstream calls.
+#
+# If several threads ask for the same key at the same time, only the first
+# ("leader") runs the function; the others block until it finishes and get
+# the same result (or the same exception). Once the call returns, the key is
+# forgotten, so this is NOT a cache — apps/problems/cache.py does that.
+
+import asyncio
+import functools
+import threading
+import weakref
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class Group:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._leaders = 0
+        self._deduplicated = 0
+
+    def do(self, key, fn):
+        """Run fn() once for all concurrent callers sharing `key`."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                self._leaders += 1
+                leader = True
+            else:
+                self._deduplicated += 1
+                leader = False
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result
+
+    def coalesce(self, name: str):
+        """
+        Decorator for fetchers shaped like f(username, *args).
+        The key is (name, lowercased username, *args).
+        """
+        def deco(fn):
+            @functools.wraps(fn)
+            def wrapper(username, *args):
+                key = (name, (username or "").strip().lower(), *args)
+                return self.do(key, lambda: fn(username, *args))
+            return wrapper
+        return deco
+
+    def metrics(self) -> dict:
+        """{upstream_calls, deduplicated, in_flight} since process start."""
+        with self._lock:
+            return {
+                "upstream_calls": self._leaders,
+                "deduplicated": self._deduplicated,
+                "in_flight": len(self._calls),
+            }
+
+
+class AsyncGroup:
+    """
+    Same idea for coroutines. Tasks belong to one event loop, so in-flight
+    calls are tracked per loop (an ASGI worker normally has exactly one).
+
+    The call runs as its own task and every caller (the first one included)
+    awaits it through asyncio.shield(): a caller that is cancelled (client
+    disconnect, a deadline) stops waiting without cancelling the call for the
+    others.
+    """
+    def __init__(self):
+        self._calls = weakref.WeakKeyDictionary()  # loop -> {key: Task}
+        self._leaders = 0
+        self._deduplicated = 0
+
+    async def do(self, key, afn):
+        """Await afn() once for all concurrent callers sharing `key`."""
+        loop = asyncio.get_running_loop()
+        calls = self._calls.setdefault(loop, {})
+        task = calls.get(key)
+        if task is not None:
+            self._deduplicated += 1
+        else:
+            task = calls[key] = loop.create_task(afn())
+            self._leaders += 1
+
+            def forget(t):
+                if calls.get(key) is t:
+                    del calls[key]
+                if not t.cancelled():
+                    t.exception()  # mark retrieved: no "never retrieved" warning without waiters
+
+            task.add_done_callback(forget)
+        return await asyncio.shield(task)
+
+    def coalesce(self, name: str):
+        """Async twin of Group.coalesce."""
+        def deco(afn):
+            @functools.wraps(afn)
+            async def wrapper(username, *args):
+                key = (name, (username or "").strip().lower(), *args)
+                return await self.do(key, lambda: afn(username, *args))
+            return wrapper
+        return deco
+
+    def metrics(self) -> dict:
+        return {
+            "upstream_calls": self._leaders,
+            "deduplicated": self._deduplicated,
+            "in_flight": sum(len(c) for c in list(self._calls.values())),
+        }
+
+
+# shared by all LeetCode fetchers in this process
+leetcode = Group()
+leetcode_async = AsyncGroup()
@@ -0,0 +1,80 @@
+# server/apps/problems/streaks.py
+#
+# Streak computation over active days only.
+#
+# Days are turned into proleptic ordinals (date.toordinal()), sorted, and
+# scanned once: a run continues while each ordinal is the previous one + 1.
+# Cost is O(k log k) for k active days (O(k) if already sorted), independent
+# of how many calendar days the history spans.
+#
+# Benchmark against the old day-by-day walk: python bench_streaks.py
+
+from datetime import date, datetime, timezone
+
+
+def _ordinal(d) -> int:
+    if isinstance(d, date):
+        return d.toordinal()
+    return date.fromisoformat(str(d)[:10]).toordinal()
+
+
+def streaks_from_ordinals(ordinals, today: int) -> tuple[int, int]:
+    """
+    ordinals: SORTED, distinct ordinals of active days.
+    -> (current_streak, max_streak); current counts the run ending on `today`.
+    Days after `today` are ignored.
+    """
+    mx = 0
+    run = 0
+    prev = None
+    for o in ordinals:
+        if o > today:
+            break
+        run = run + 1 if prev is not None and o == prev + 1 else 1
+        if run > mx:
+            mx = run
+        prev = o
+    current = run if prev == today else 0
+    return current, mx
+
+
+def streaks_from_days(day_counts: dict, today: date = None) -> tuple[int, int]:
+    """
+    day_counts: { date | 'YYYY-MM-DD': int } -> (current_streak, max_streak).
+    Days with a count of 0 are not active.
+    """
+    if today is None:
+        today = datetime.now(timezone.utc).date()
+    active = sorted({_ordinal(d) for d, c in day_counts.items() if c and c > 0})
+    return streaks_from_ordinals(active, today.toordinal())
+
+
+# ---- incremental state (stored on CalendarSync, see submissions.ingest) ----
+
+def advance(run_start, last_active, max_run: int, active_days) -> tuple:
+    """
+    Fold newly ingested active days into stored streak state.
+
+    run_start / last_active: dates of the latest run (None if no activity yet)
+    active_days: sorted dates with a count > 0; days <= last_active are
+                 already counted and skipped.
+    -> (run_start, last_active, max_run)
+    """
+    for d in active_days:
+        if last_active is not None:
+            if d <= last_active:
+                continue
+            if d.toordinal() != last_active.toordinal() + 1:
+                run_start = d
+        else:
+            run_start = d
+        last_active = d
+        max_run = max(max_run, (last_active - run_start).days + 1)
+    return run_start, last_active, max_run
+
+
+def current_streak(run_start, last_active, today: date) -> int:
+    """Length of the stored run if it reaches `today`, else 0 (same rule as above)."""
+    if last_active is None or run_start is None or last_active != today:
+        return 0
+    return (last_active - run_start).days + 1
@@ -0,0 +1,167 @@
+# server/apps/problems/submissions.py
+#
+# Stored per-day submission counts (SubmissionDay) and their incremental ingestion.
+#
+# LeetCode hands us the whole submissionCalendar blob every time. We write
+# the days from the last stored day onwards (the last day is rewritten because
+# its count can still grow) plus any older day that isn't in the table yet,
+# so a partial fetch never leaves a permanent hole.
+
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+
+from django.db import transaction
+from django.db.models import Count, Sum
+from django.utils import timezone
+
+from apps.leaderboard.models import LeaderboardEntry
+from apps.users.models import Profile
+from .models import CalendarSync, SubmissionDay
+from .streaks import advance
+
+
+def utc_today() -> date:
+    return datetime.now(dt_timezone.utc).date()
+
+
+def user_key(username: str) -> str:
+    return (username or "").strip().lower()
+
+
+def per_day_counts(raw: dict) -> dict:
+    """{unix_ts_str: count} -> {date: count} (UTC days, summed)."""
+    per_day = defaultdict(int)
+    for ts_str, cnt in (raw or {}).items():
+        try:
+            d = datetime.fromtimestamp(int(ts_str), tz=dt_timezone.utc).date()
+            per_day[d] += int(cnt or 0)
+        except Exception:
+            continue
+    return per_day
+
+
+def sync_state(username: str):
+    return CalendarSync.objects.filter(leetcode_username=user_key(username)).first()
+
+
+def synced_keys(keys: list) -> set:
+    """The user_key()s among `keys` whose calendar has been ingested at least once."""
+    return set(
+        CalendarSync.objects.filter(leetcode_username__in=keys)
+        .values_list("leetcode_username", flat=True)
+    )
+
+
+def is_fresh(state, max_age_seconds: int) -> bool:
+    return bool(
+        state and state.fetched_at
+        and state.fetched_at >= timezone.now() - timedelta(seconds=max_age_seconds)
+    )
+
+
+def publish_streak(key: str, run_start, last_active) -> None:
+    """
+    Copy a user's latest run onto Profile and the leaderboard. Readers treat it
+    as the current streak only while its last day is today, so it drops to 0
+    at day rollover without anyone re-ingesting.
+    """
+    days = (last_active - run_start).days + 1 if run_start and last_active else 0
+    fields = {"streak_days": days, "streak_through": last_active}
+    Profile.objects.filter(leetcode_username__iexact=key).update(**fields)
+    LeaderboardEntry.objects.filter(leetcode_username__iexact=key).update(**fields)
+
+
+def _stored_days(key: str, start: date, end: date) -> set:
+    return set(
+        SubmissionDay.objects
+        .filter(leetcode_username=key, date__gte=start, date__lt=end)
+        .values_list("date", flat=True)
+    )
+
+
+def _streak_state(key: str) -> tuple:
+    """(run_start, last_active, max_run) recomputed from every stored active day."""
+    active = (
+        SubmissionDay.objects
+        .filter(leetcode_username=key, count__gt=0)
+        .order_by("date")
+        .values_list("date", flat=True)
+    )
+    return advance(None, None, 0, active.iterator(chunk_size=2000))
+
+
+def ingest(username: str, raw: dict, covered_from: date = None, tried_from: date = None) -> CalendarSync:
+    """
+    Store new days from a submissionCalendar payload and fold them into the
+    user's streak state. Returns the updated CalendarSync row.
+    `covered_from`: the payload holds every day from this date on (complete
+    per-year fetches); extends CalendarSync.first_day.
+    `tried_from`: start of the oldest year this fetch asked for, complete or
+    not (CalendarSync.tried_from).
+
+    Days from the last stored day onwards are upserted; older days are only
+    written if they aren't stored yet, so a payload that fills a gap (a year
+    that failed to fetch last time, or a longer window) backfills it. A
+    backfilled active day before the stored run rebuilds the streak state.
+    """
+    key = user_key(username)
+    per_day = per_day_counts(raw)
+
+    with transaction.atomic():
+        state, _ = CalendarSync.objects.select_for_update().get_or_create(leetcode_username=key)
+        since = state.last_day
+        older = [d for d in per_day if since is not None and d < since]
+        stored = _stored_days(key, min(older), since) if older else set()
+        new = sorted(
+            (d, c) for d, c in per_day.items()
+            if since is None or d >= since or d not in stored
+        )
+        if new:
+            SubmissionDay.objects.bulk_create(
+                [SubmissionDay(leetcode_username=key, date=d, count=c) for d, c in new],
+                update_conflicts=True,
+                unique_fields=["leetcode_username", "date"],
+                update_fields=["count"],
+                batch_size=500,
+            )
+            state.last_day = max(new[-1][0], since or new[-1][0])
+            active = [d for d, c in new if c > 0]
+            if since is not None and active and active[0] < since:
+                state.run_start, state.last_active, state.max_run = _streak_state(key)
+            else:
+                state.run_start, state.last_active, state.max_run = advance(
+                    state.run_start, state.last_active, state.max_run, active,
+                )
+        if covered_from is not None and (state.first_day is None or covered_from < state.first_day):
+            state.first_day = covered_from
+        if tried_from is not None:
+            state.tried_from = tried_from
+        state.fetched_at = timezone.now()
+        state.save(update_fields=["last_day", "first_day", "tried_from", "fetched_at",
+                                  "run_start", "last_active", "max_run"])
+        publish_streak(key, state.run_start, state.last_active)
+    return state
+
+
+def daily_counts(username: str, start: date, end: date) -> dict:
+    """{date: count} for active days in [start, end] — one indexed range scan."""
+    return dict(
+        SubmissionDay.objects
+        .filter(leetcode_username=user_key(username), date__gte=start, date__lte=end)
+        .values_list("date", "count")
+    )
+
+
+def group_daily_counts(keys: list, start: date, end: date) -> list:
+    """
+    [(date, summed count, active members)] for the days in [start, end] on
+    which any of `keys` (user_key()s) submitted -- one grouped query.
+    """
+    return list(
+        SubmissionDay.objects
+        .filter(leetcode_username__in=keys, date__gte=start, date__lte=end, count__gt=0)
+        .values("date")
+        .annotate(total=Sum("count"), active=Count("leetcode_username"))
+        .order_by("date")
+        .values_list("date", "total", "active")
+    )
@@ -1,3 +1,155 @@
-from django.test import TestCase
+from datetime import date, datetime, timedelta, timezone
+from unittest import mock
 
-# Create your tests here.
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from leetcode_stub import StubLeetCode
+from . import breaker, streaks, submissions, upstream
+from .models import CalendarSync, SubmissionDay
+from .streaks import streaks_from_days
+from .views import _calendar_years
+
+
+def _this_year() -> int:
+    return datetime.now(timezone.utc).date().year
+
+
+class CalendarYearsTests(SimpleTestCase):
+    def test_first_fetch_takes_the_whole_window(self):
+        year = _this_year()
+        self.assertEqual(_calendar_years(year - 2, None, False), [year - 2, year - 1, year])
+
+    def test_stale_refetches_from_the_newest_stored_year(self):
+        year = _this_year()
+        state = CalendarSync(last_day=date(year - 1, 12, 30), first_day=date(year - 3, 1, 1))
+        self.assertEqual(_calendar_years(year - 3, state, False), [year - 1, year])
+
+    def test_fresh_and_covered_fetches_nothing(self):
+        year = _this_year()
+        state = CalendarSync(last_day=date(year, 1, 5), first_day=date(year - 1, 1, 1))
+        self.assertEqual(_calendar_years(year - 1, state, True), [])
+
+    def test_longer_window_backfills(self):
+        year = _this_year()
+        state = CalendarSync(last_day=date(year, 1, 5), first_day=date(year, 1, 1),
+                             tried_from=date(year, 1, 1))
+        self.assertEqual(_calendar_years(year - 2, state, True), [year - 2, year - 1])
+
+    def test_fresh_does_not_retry_years_already_tried(self):
+        year = _this_year()
+        state = CalendarSync(first_day=None, tried_from=date(year - 1, 1, 1))
+        self.assertEqual(_calendar_years(year - 1, state, True), [])
+        self.assertEqual(_calendar_years(year - 2, state, True), [year - 2])
+
+
+@override_settings(LEETCODE_RATE_LIMIT=0, LEETCODE_CALENDAR_FRESH_SECONDS=300)
+class CalendarFetchTests(TestCase):
+    def setUp(self):
+        self.stub = StubLeetCode().start()
+        self.addCleanup(self.stub.stop)
+        settings = override_settings(LEETCODE_BASE_URL=self.stub.url)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        for module in (upstream, breaker):
+            module.reset()
+            self.addCleanup(module.reset)
+
+    def calendar(self, username):
+        return self.client.get(f"/api/problems/leetcode/{username}/calendar/")
+
+    def test_missing_user_is_not_refetched_while_fresh(self):
+        self.stub.missing.add("ghost")
+        self.assertEqual(self.calendar("ghost").status_code, 200)
+        state = CalendarSync.objects.get(leetcode_username="ghost")
+        self.assertIsNotNone(state.first_day)
+        self.assertIsNone(state.last_day)
+
+        self.stub.reset_counts()
+        for _ in range(2):
+            self.assertEqual(self.calendar("ghost").status_code, 200)
+        self.assertEqual(self.stub.requests, 0)
+
+    def test_active_user_is_not_refetched_while_fresh(self):
+        self.assertEqual(self.calendar("alice").status_code, 200)
+        self.stub.reset_counts()
+        self.calendar("alice")
+        self.assertEqual(self.stub.requests, 0)
+
+    def test_stale_missing_user_is_refetched(self):
+        self.stub.missing.add("ghost")
+        self.calendar("ghost")
+        CalendarSync.objects.filter(leetcode_username="ghost").update(
+            fetched_at=datetime.now(timezone.utc) - timedelta(hours=1))
+        self.stub.reset_counts()
+        self.calendar("ghost")
+        self.assertGreater(self.stub.requests, 0)
+
+
+def _payload(days: dict) -> dict:
+    """{date: count} -> submissionCalendar blob ({unix ts: count})."""
+    return {
+        str(int(datetime(d.year, d.month, d.day, tzinfo=timezone.utc).timestamp())): c
+        for d, c in days.items()
+    }
+
+
+class IngestTests(TestCase):
+    def setUp(self):
+        self.today = submissions.utc_today()
+
+    def days_ago(self, *offsets, count=1):
+        return {self.today - timedelta(days=o): count for o in offsets}
+
+    def stored(self):
+        return dict(SubmissionDay.objects.filter(leetcode_username="alice").values_list("date", "count"))
+
+    def assertStreaksMatch(self, state):
+        current, longest = streaks_from_days(self.stored(), self.today)
+        self.assertEqual(streaks.current_streak(state.run_start, state.last_active, self.today), current)
+        self.assertEqual(state.max_run, longest)
+
+    def test_incremental(self):
+        submissions.ingest("Alice", _payload(self.days_ago(9, 8, 7, 3, 2)))
+        later = {**self.days_ago(9, 8, 7, 3), **self.days_ago(2, count=4), **self.days_ago(1, 0)}
+        state = submissions.ingest("alice", _payload(later))
+        self.assertEqual(self.stored(), later)
+        self.assertEqual(state.last_day, self.today)
+        self.assertEqual(state.max_run, 4)
+        self.assertStreaksMatch(state)
+
+    def test_backfills_a_year_that_failed_before(self):
+        old = self.days_ago(400, 399, 398)
+        recent = self.days_ago(5, 4)
+        submissions.ingest("alice", _payload(recent))  # last year's query failed
+        state = submissions.ingest("alice", _payload({**old, **recent}))
+        self.assertEqual(self.stored(), {**old, **recent})
+        self.assertEqual(state.max_run, 3)
+        self.assertStreaksMatch(state)
+
+    def test_backfilled_day_before_the_run_rebuilds_streaks(self):
+        submissions.ingest("alice", _payload(self.days_ago(2, 1, 0)))
+        gap = self.days_ago(5, 4, 3)  # joins the stored run into one of 6 days
+        with mock.patch.object(submissions, "_streak_state", wraps=submissions._streak_state) as rebuild:
+            state = submissions.ingest("alice", _payload({**gap, **self.days_ago(2, 1, 0)}))
+        rebuild.assert_called_once_with("alice")
+        self.assertEqual((state.run_start, state.last_active, state.max_run),
+                         (self.today - timedelta(days=5), self.today, 6))
+        self.assertStreaksMatch(state)
+
+    def test_new_days_only_advance_the_stored_run(self):
+        submissions.ingest("alice", _payload(self.days_ago(3, 2)))
+        with mock.patch.object(submissions, "_streak_state", wraps=submissions._streak_state) as rebuild:
+            state = submissions.ingest("alice", _payload(self.days_ago(3, 2, 1, 0)))
+        rebuild.assert_not_called()
+        self.assertStreaksMatch(state)
+
+    def test_first_day_only_moves_earlier(self):
+        year = self.today.year
+        state = submissions.ingest("alice", {}, covered_from=date(year - 1, 1, 1))
+        self.assertEqual(state.first_day, date(year - 1, 1, 1))
+        state = submissions.ingest("alice", {}, covered_from=date(year, 1, 1))
+        self.assertEqual(state.first_day, date(year - 1, 1, 1))
+        state = submissions.ingest("alice", {})
+        self.assertEqual(state.first_day, date(year - 1, 1, 1))
+        state = submissions.ingest("alice", {}, covered_from=date(year - 3, 1, 1))
+        self.assertEqual(state.first_day, date(year - 3, 1, 1))
@@ -0,0 +1,162 @@
+# server/apps/problems/upstream.py
+#
+# Shared HTTP client for all LeetCode traffic.
+#
+# - one urllib3 pool manager (via a single HTTPAdapter) for the whole process,
+#   so TCP+TLS connections are kept alive and reused between requests
+# - per-host pool size is capped (LEETCODE_HTTP_POOL_MAXSIZE) and blocks
+#   instead of opening extra connections when every slot is busy
+# - 429/5xx are retried with exponential backoff (honours Retry-After, capped
+#   at LEETCODE_HTTP_BACKOFF_MAX so one 429 can't park a thread for minutes)
+# - connect/read timeouts come from settings instead of a hard-coded 15s
+# - every call passes the circuit breaker / rate budget in breaker.py first
+#
+# requests.Session keeps cookies and isn't documented as thread-safe, so each
+# thread gets its own Session, all mounted on the same (thread-safe) adapter.
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from . import breaker
+
+USER_AGENT = "dsa-tracker/1.0"
+
+_lock = threading.Lock()
+_adapter = None
+_executor = None
+_local = threading.local()
+
+
+def base_url() -> str:
+    return getattr(settings, "LEETCODE_BASE_URL", "https://leetcode.com").rstrip("/")
+
+
+def graphql_url() -> str:
+    return f"{base_url()}/graphql"
+
+
+def leetcode_headers(username: str, json: bool = False) -> dict:
+    """Headers LeetCode expects from a browser-ish client looking at <username>."""
+    headers = {
+        "Referer": f"https://leetcode.com/{username}/",
+        "Origin": "https://leetcode.com",
+        "User-Agent": USER_AGENT,
+    }
+    if json:
+        headers["Content-Type"] = "application/json"
+    return headers
+
+
+def backoff_max() -> float:
+    """Longest sleep between two attempts, Retry-After included."""
+    return getattr(settings, "LEETCODE_HTTP_BACKOFF_MAX", 2.0)
+
+
+class _Retry(Retry):
+    # urllib3 < 2.6 sleeps for whatever Retry-After says; this thread may be
+    # holding a single-flight key and the breaker's half-open probe meanwhile
+    def get_retry_after(self, response):
+        after = super().get_retry_after(response)
+        return None if after is None else min(after, backoff_max())
+
+
+def _build_adapter() -> HTTPAdapter:
+    retry = _Retry(
+        total=getattr(settings, "LEETCODE_HTTP_RETRIES", 2),
+        connect=getattr(settings, "LEETCODE_HTTP_RETRIES", 2),
+        read=0,  # a read timeout already cost us the full read budget
+        backoff_factor=getattr(settings, "LEETCODE_HTTP_BACKOFF", 0.3),
+        backoff_max=backoff_max(),
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "POST"}),  # our POSTs are GraphQL reads
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    return HTTPAdapter(
+        pool_connections=getattr(settings, "LEETCODE_HTTP_POOL_CONNECTIONS", 4),
+        pool_maxsize=getattr(settings, "LEETCODE_HTTP_POOL_MAXSIZE", 16),
+        pool_block=True,
+        max_retries=retry,
+    )
+
+
+def _get_adapter() -> HTTPAdapter:
+    global _adapter
+    if _adapter is None:
+        with _lock:
+            if _adapter is None:
+                _adapter = _build_adapter()
+    return _adapter
+
+
+def session() -> requests.Session:
+    """Per-thread Session sharing the process-wide connection pool."""
+    s = getattr(_local, "session", None)
+    if s is None:
+        s = requests.Session()
+        adapter = _get_adapter()
+        s.mount("http://", adapter)
+        s.mount("https://", adapter)
+        _local.session = s
+    return s
+
+
+def executor() -> ThreadPoolExecutor:
+    """Bounded pool for fanning out independent upstream calls."""
+    global _executor
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=getattr(settings, "LEETCODE_FETCH_WORKERS", 8),
+                    thread_name_prefix="lc-fetch",
+                )
+    return _executor
+
+
+def timeout() -> tuple:
+    return (
+        getattr(settings, "LEETCODE_HTTP_CONNECT_TIMEOUT", 3.05),
+        getattr(settings, "LEETCODE_HTTP_READ_TIMEOUT", 10),
+    )
+
+
+def request(method: str, url: str, **kwargs) -> requests.Response:
+    kwargs.setdefault("timeout", timeout())
+    circuit = breaker.acquire(breaker.endpoint_for(url))
+    try:
+        resp = session().request(method, url, **kwargs)
+    except requests.RequestException:
+        circuit.record_failure()
+        raise
+    except BaseException:
+        circuit.release()
+        raise
+    if breaker.is_failure_status(resp.status_code):
+        circuit.record_failure()
+    else:
+        circuit.record_success()
+    return resp
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    return request("GET", url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    return request("POST", url, **kwargs)
+
+
+def reset() -> None:
+    """Drop pooled connections (tests, or after settings change)."""
+    global _adapter
+    with _lock:
+        if _adapter is not None:
+            _adapter.close()
+        _adapter = None
+    _local.__dict__.clear()
@@ -1,8 +1,18 @@
 # ADD in problems/urls.py
+from django.conf import settings
 from django.urls import path
-from .views import leetcode_stats,leetcode_calendar
+from .views import leetcode_stats,leetcode_calendar,leetcode_stats_batch,leetcode_group_calendar,leetcode_upstream_status,problem_search
+
+if getattr(settings, "LEETCODE_ASYNC_VIEWS", False):
+    # ASGI deployments: upstream waits don't hold a worker thread
+    from .async_views import leetcode_stats, leetcode_calendar  # noqa: F811
 
 urlpatterns = [
+    path("search/", problem_search, name="problem-search"),
+    # must come before leetcode/<username>/... or "batch" / "group" / "status" is taken as a username
+    path("leetcode/batch/", leetcode_stats_batch, name="leetcode-stats-batch"),
+    path("leetcode/group/calendar/", leetcode_group_calendar, name="leetcode-group-calendar"),
+    path("leetcode/status/", leetcode_upstream_status, name="leetcode-upstream-status"),
     path("leetcode/<str:username>/", leetcode_stats, name="leetcode-stats"),
     path("leetcode/<str:username>/calendar/", leetcode_calendar, name="leetcode-calendar"),
 ]
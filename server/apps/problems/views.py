@@ -1,100 +1,255 @@
 # server/apps/problems/views.py
 
+from django.conf import settings
 from django.http import JsonResponse
-from django.views.decorators.http import require_GET
-from datetime import datetime, timezone, timedelta
-from collections import defaultdict
+from django.utils.cache import patch_vary_headers
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET, require_POST
+from concurrent.futures import wait
+from datetime import date, datetime, timezone, timedelta
 import json
+import time
 import requests
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
 
-LEETCODE_GRAPHQL = "https://leetcode.com/graphql"
+from apps.users import sync as profile_sync
+from . import breaker
+from . import cache as lc_cache
+from . import heatmap
+from .breaker import UpstreamUnavailable
+from .conditional import conditional_response, make_etag
+from . import search
+from . import submissions
+from . import streaks
+from . import upstream
+from . import singleflight
+from .singleflight import leetcode as inflight
+
+def _max_age() -> int:
+    return getattr(settings, "LEETCODE_RESPONSE_MAX_AGE", 60)
+
+def _unavailable(e: UpstreamUnavailable) -> JsonResponse:
+    """Fast 503 while the circuit is open / the outbound budget is spent."""
+    resp = JsonResponse({"error": "upstream_unavailable", "detail": e.reason}, status=503)
+    resp["Retry-After"] = str(e.retry_after)
+    return resp
 
 # =========================
 # LeetCode STATS (rank + totals + difficulty split)
 # =========================
 
-_STATS_QUERY = """
-query userProfile($username: String!) {
-  matchedUser(username: $username) {
+_STATS_FIELDS = """
     username
     profile { ranking }
     submitStats: submitStatsGlobal {
       acSubmissionNum { difficulty count }
     }
-  }
+"""
+
+_STATS_QUERY = """
+query userProfile($username: String!) {
+  matchedUser(username: $username) {""" + _STATS_FIELDS + """  }
 }
 """
 
+def _parse_matched_user(mu):
+    """matchedUser node -> our stats dict (None if the user doesn't exist)."""
+    if not mu:
+        return None
+
+    ranking = (mu.get("profile") or {}).get("ranking")
+    ac = (mu.get("submitStats") or {}).get("acSubmissionNum") or []
+    diff = {row.get("difficulty"): int(row.get("count") or 0) for row in ac}
+
+    return {
+        "username": mu.get("username"),
+        "ranking": ranking,
+        "totalSolved": diff.get("All", 0),
+        "easy": diff.get("Easy", 0),
+        "medium": diff.get("Medium", 0),
+        "hard": diff.get("Hard", 0),
+    }
+
+@inflight.coalesce("stats")
+def _fetch_leetcode_stats(username: str):
+    """Query LeetCode for one user's stats. Returns the response dict, or None if not found."""
+    resp = upstream.post(
+        upstream.graphql_url(),
+        json={"query": _STATS_QUERY, "variables": {"username": username}},
+        headers=upstream.leetcode_headers(username, json=True),
+    )
+    resp.raise_for_status()
+    return _parse_matched_user((resp.json().get("data") or {}).get("matchedUser"))
+
+def _fetch_leetcode_stats_chunk(usernames: list) -> dict:
+    """
+    Stats for several users in ONE GraphQL document using aliases:
+        query batchStats($u0: String!, $u1: String!) { u0: matchedUser(username: $u0) {...} u1: ... }
+    Returns {username: stats or None}.
+    """
+    aliases = {f"u{i}": u for i, u in enumerate(usernames)}
+    params = ", ".join(f"${a}: String!" for a in aliases)
+    fields = "".join(
+        f"  {a}: matchedUser(username: ${a}) {{{_STATS_FIELDS}  }}\n" for a in aliases
+    )
+    resp = upstream.post(
+        upstream.graphql_url(),
+        json={"query": f"query batchStats({params}) {{\n{fields}}}", "variables": aliases},
+        headers=upstream.leetcode_headers(usernames[0], json=True),
+    )
+    resp.raise_for_status()
+    data = resp.json().get("data") or {}
+    return {u: _parse_matched_user(data.get(a)) for a, u in aliases.items()}
+
+def fetch_leetcode_stats_many(usernames: list, use_cache: bool = True) -> dict:
+    """
+    Stats for many users: fresh cache entries first (unless use_cache=False),
+    then chunked aliased queries (run concurrently on the upstream pool) for
+    the rest, including entries past LEETCODE_CACHE_TTL. Fresh results are
+    cached; a user whose refetch fails gets their stale entry if there is one.
+
+    Returns {username: stats dict | None (not found) | Exception (fetch failed)}.
+    """
+    out = {}
+    stale = {}
+    missing = []
+    for u in usernames:
+        hit, fresh = lc_cache.peek(lc_cache.cache_key("stats", u)) if use_cache else (lc_cache.MISSING, False)
+        if fresh:
+            out[u] = hit
+            continue
+        if hit is not lc_cache.MISSING and hit is not None:
+            stale[u] = hit
+        missing.append(u)
+
+    size = max(1, getattr(settings, "LEETCODE_BATCH_CHUNK", 50))
+    chunks = [missing[i:i + size] for i in range(0, len(missing), size)]
+    pool = upstream.executor()
+    futures = {pool.submit(_fetch_leetcode_stats_chunk, c): c for c in chunks}
+    for f, chunk in futures.items():
+        try:
+            part = f.result()
+        except Exception as e:
+            out.update({u: stale.get(u, e) for u in chunk})
+            continue
+        for u, stats in part.items():
+            lc_cache.store(lc_cache.cache_key("stats", u), stats)
+            out[u] = stats
+    return {u: out[u] for u in usernames if u in out}
+
+def _stats_response(request, stats: dict, synced_at=None):
+    return conditional_response(
+        request,
+        lambda: JsonResponse(stats, status=200),
+        etag=make_etag("stats", stats),
+        last_modified=synced_at,
+        max_age=_max_age(),
+    )
+
 @require_GET
 def leetcode_stats(request, username: str):
     """
     GET /api/problems/leetcode/<username>/
     -> { username, ranking, totalSolved, easy, medium, hard }
+
+    Served from a recently synced Profile (apps/users/sync.py) or the LeetCode
+    cache (apps/problems/cache.py) when possible. While LeetCode is unreachable
+    (apps/problems/breaker.py) an older synced Profile is served, else 503.
+    Carries an ETag (and Last-Modified when served from a Profile): a
+    matching conditional request gets a 304.
     """
     try:
-        headers = {
-            "Content-Type": "application/json",
-            "Referer": f"https://leetcode.com/{username}/",
-            "Origin": "https://leetcode.com",
-            "User-Agent": "dsa-tracker/1.0",
-        }
-        resp = requests.post(
-            LEETCODE_GRAPHQL,
-            json={"query": _STATS_QUERY, "variables": {"username": username}},
-            headers=headers,
-            timeout=15,
+        profile = profile_sync.fresh_profile(username)
+        if profile is not None:
+            return _stats_response(request, profile_sync.profile_stats(profile), profile.last_sync_at)
+
+        stats = lc_cache.get_or_fetch(
+            lc_cache.cache_key("stats", username),
+            lambda: _fetch_leetcode_stats(username),
         )
-        resp.raise_for_status()
-        mu = (resp.json().get("data") or {}).get("matchedUser")
-        if not mu:
+        if stats is None:
             return JsonResponse({"error": "not_found"}, status=404)
+        return _stats_response(request, stats)
 
-        ranking = (mu.get("profile") or {}).get("ranking")
-        ac = (mu.get("submitStats") or {}).get("acSubmissionNum") or []
-        diff = {row.get("difficulty"): int(row.get("count") or 0) for row in ac}
-
-        return JsonResponse({
-            "username": mu.get("username"),
-            "ranking": ranking,
-            "totalSolved": diff.get("All", 0),
-            "easy": diff.get("Easy", 0),
-            "medium": diff.get("Medium", 0),
-            "hard": diff.get("Hard", 0),
-        }, status=200)
-
+    except UpstreamUnavailable as e:
+        profile = profile_sync.fresh_profile(username, stale_ok=True)
+        if profile is not None:
+            return _stats_response(request, profile_sync.profile_stats(profile), profile.last_sync_at)
+        return _unavailable(e)
     except requests.HTTPError as e:
         return JsonResponse({"error": "stats_failed", "detail": f"http {e}"}, status=502)
     except Exception as e:
         return JsonResponse({"error": "stats_failed", "detail": str(e)}, status=502)
 
+def _body_usernames(request):
+    """
+    Usernames from a { "usernames": [...] } POST body, duplicates (case-insensitive)
+    dropped, at most LEETCODE_BATCH_MAX; or the 400 JsonResponse to send instead.
+    """
+    try:
+        body = json.loads(request.body or b"{}")
+    except ValueError:
+        return JsonResponse({"error": "invalid_json"}, status=400)
+    names = body.get("usernames") if isinstance(body, dict) else None
+    if not isinstance(names, list) or not all(isinstance(u, str) for u in names):
+        return JsonResponse({"error": "usernames must be a list of strings"}, status=400)
+
+    seen = set()
+    usernames = []
+    for u in names:
+        u = u.strip()
+        if u and u.lower() not in seen:
+            seen.add(u.lower())
+            usernames.append(u)
+    limit = getattr(settings, "LEETCODE_BATCH_MAX", 500)
+    if len(usernames) > limit:
+        return JsonResponse({"error": f"at most {limit} usernames per request"}, status=400)
+    return usernames
+
+@csrf_exempt
+@require_POST
+def leetcode_stats_batch(request):
+    """
+    POST /api/problems/leetcode/batch/   { "usernames": ["alice", "bob", ...] }
+    -> { results: { <username>: {stats...} | {error, detail?} } }
+
+    Up to LEETCODE_BATCH_MAX users per call; duplicates (case-insensitive) are dropped.
+    """
+    usernames = _body_usernames(request)
+    if isinstance(usernames, JsonResponse):
+        return usernames
+
+    results = {}
+    for u, stats in fetch_leetcode_stats_many(usernames).items():
+        if isinstance(stats, UpstreamUnavailable):
+            results[u] = {"error": "upstream_unavailable", "detail": stats.reason}
+        elif isinstance(stats, requests.HTTPError):
+            results[u] = {"error": "stats_failed", "detail": f"http {stats}"}
+        elif isinstance(stats, Exception):
+            results[u] = {"error": "stats_failed", "detail": str(stats)}
+        elif stats is None:
+            results[u] = {"error": "not_found"}
+        else:
+            results[u] = stats
+    return JsonResponse({"results": results}, status=200)
+
 
 # =========================
 # LeetCode CALENDAR (daily counts + streaks)
 # =========================
 
-def _graphql_user_calendar(username: str, year: int) -> dict:
-    """Return dict {unix_ts_str: count} for a given year using GraphQL."""
-    query = """
-    query userCalendar($username: String!, $year: Int!) {
-      userCalendar(username: $username, year: $year) {
-        submissionCalendar
-      }
-    }
-    """
-    headers = {
-        "Content-Type": "application/json",
-        "Referer": f"https://leetcode.com/{username}/",
-        "Origin": "https://leetcode.com",
-        "User-Agent": "dsa-tracker/1.0",
-    }
-    r = requests.post(
-        LEETCODE_GRAPHQL,
-        json={"query": query, "variables": {"username": username, "year": year}},
-        headers=headers,
-        timeout=15,
-    )
-    r.raise_for_status()
-    node = (r.json().get("data") or {}).get("userCalendar")
+_CALENDAR_QUERY = """
+query userCalendar($username: String!, $year: Int!) {
+  userCalendar(username: $username, year: $year) {
+    submissionCalendar
+  }
+}
+"""
+
+def _parse_graphql_calendar(body: dict) -> dict:
+    node = (body.get("data") or {}).get("userCalendar")
     if not node:
         return {}
     raw = node.get("submissionCalendar") or "{}"
@@ -103,57 +258,118 @@ def _graphql_user_calendar(username: str, year: int) -> dict:
     except Exception:
         return {}
 
+def _parse_rest_calendar(payload) -> dict:
+    """REST endpoints return the calendar either as JSON or as a JSON-encoded string."""
+    if isinstance(payload, str):
+        payload = json.loads(payload or "{}")
+    return payload or {}
+
+@inflight.coalesce("calendar-graphql")
+def _graphql_user_calendar(username: str, year: int) -> dict:
+    """Return dict {unix_ts_str: count} for a given year using GraphQL."""
+    r = upstream.post(
+        upstream.graphql_url(),
+        json={"query": _CALENDAR_QUERY, "variables": {"username": username, "year": year}},
+        headers=upstream.leetcode_headers(username, json=True),
+    )
+    r.raise_for_status()
+    return _parse_graphql_calendar(r.json())
+
+@inflight.coalesce("calendar-rest")
 def _rest_user_calendar(username: str) -> dict:
     """Fallback to the REST endpoints. Returns dict {unix_ts_str: count}."""
-    headers = {
-        "User-Agent": "dsa-tracker/1.0",
-        "Referer": f"https://leetcode.com/{username}/",
-        "Origin": "https://leetcode.com",
-    }
+    headers = upstream.leetcode_headers(username)
     # 1) path-style
-    u1 = f"https://leetcode.com/api/user_submission_calendars/{username}/"
-    r = requests.get(u1, headers=headers, timeout=15)
+    u1 = f"{upstream.base_url()}/api/user_submission_calendars/{username}/"
+    r = upstream.get(u1, headers=headers)
     if r.ok:
         try:
-            payload = r.json()
-            if isinstance(payload, str):
-                payload = json.loads(payload or "{}")
-            return payload or {}
+            return _parse_rest_calendar(r.json())
         except Exception:
             pass
 
     # 2) query-style
-    u2 = "https://leetcode.com/api/user_submission_calendar/"
-    r = requests.get(u2, params={"username": username}, headers=headers, timeout=15)
+    u2 = f"{upstream.base_url()}/api/user_submission_calendar/"
+    r = upstream.get(u2, params={"username": username}, headers=headers)
     r.raise_for_status()
     try:
-        payload = r.json()
-        if isinstance(payload, str):
-            payload = json.loads(payload or "{}")
-        return payload or {}
+        return _parse_rest_calendar(r.json())
     except Exception:
         return {}
 
-def _fetch_leetcode_calendar(username: str) -> dict:
-    """Combine current + previous year via GraphQL; fallback to REST."""
+def _calendar_years(start_year: int, state, fresh: bool) -> list:
+    """
+    Years to fetch for a calendar window starting in `start_year`:
+    - unless the stored days are fresh, the newest stored day's year onwards
+      (counts in it can still change)
+    - every year of the window older than CalendarSync.first_day (never
+      fetched completely), so longer windows backfill; while the stored days
+      are fresh, only those older than the latest fetch already tried
+    """
     today = datetime.now(timezone.utc).date()
-    years = {today.year, (today - timedelta(days=180)).year}
+    years = set()
+    if not fresh:
+        recent = state.last_day.year if state is not None and state.last_day else start_year
+        years.update(range(max(recent, start_year), today.year + 1))
+    covered = state.first_day.year if state is not None and state.first_day else today.year + 1
+    if fresh and state.tried_from:
+        covered = min(covered, state.tried_from.year)
+    years.update(range(start_year, covered))
+    return sorted(years)
+
+def _fetch_leetcode_calendar(username: str, years) -> tuple:
+    """
+    Combine the given years via GraphQL; fallback to REST.
+    -> (calendar, complete): complete when every year's query succeeded, even
+    if they were all empty (no submissions, or no such user).
+
+    The per-year queries run concurrently on the upstream pool and are merged;
+    REST is only used if none of them returned data. With
+    LEETCODE_CALENDAR_SPECULATIVE_REST the REST call is started alongside the
+    GraphQL ones instead of after them. Everything shares one deadline
+    (LEETCODE_CALENDAR_DEADLINE); calls still running past it are ignored.
+    If the breaker refused the GraphQL calls, REST is not tried and
+    UpstreamUnavailable is raised, so callers fall back to stored days.
+    """
+    deadline = time.monotonic() + getattr(settings, "LEETCODE_CALENDAR_DEADLINE", 12)
+    pool = upstream.executor()
+
+    graphql = [pool.submit(_graphql_user_calendar, username, y) for y in years]
+    rest = None
+    if getattr(settings, "LEETCODE_CALENDAR_SPECULATIVE_REST", False):
+        rest = pool.submit(_rest_user_calendar, username)
 
     combined = {}
-    try:
-        for y in years:
-            part = _graphql_user_calendar(username, y)
-            combined.update(part or {})
-    except Exception:
-        pass  # fall through to REST
+    refused = None
+    done, pending = wait(graphql, timeout=max(0, deadline - time.monotonic()))
+    complete = not pending
+    for f in done:
+        if f.exception() is None:
+            combined.update(f.result() or {})
+        else:
+            complete = False
+            if isinstance(f.exception(), UpstreamUnavailable):
+                refused = f.exception()
 
-    if not combined:
+    if combined or refused is not None:
+        if rest is not None:
+            rest.cancel()
+        if not combined:
+            raise refused
+    else:
+        if rest is None:
+            rest = pool.submit(_rest_user_calendar, username)
         try:
-            combined = _rest_user_calendar(username)
+            combined = rest.result(timeout=max(0, deadline - time.monotonic()))
+        except UpstreamUnavailable:
+            raise
         except Exception:
             combined = {}
 
-    # Normalize keys/values
+    return _clean_calendar(combined), complete
+
+def _clean_calendar(combined: dict) -> dict:
+    """Normalize keys/values of a merged submissionCalendar."""
     clean = {}
     for k, v in (combined or {}).items():
         try:
@@ -164,74 +380,254 @@ def _fetch_leetcode_calendar(username: str) -> dict:
             continue
     return clean
 
-def _calc_streaks_from_days(day_counts: dict) -> tuple[int, int]:
-    """day_counts: { 'YYYY-MM-DD': int } -> (current_streak, max_streak)."""
-    if not day_counts:
-        return 0, 0
+def _calendar_plan(username: str, start_year: int) -> tuple:
+    """(CalendarSync or None, years to fetch) for a window starting in `start_year`."""
+    state = submissions.sync_state(username)
+    fresh = submissions.is_fresh(state, getattr(settings, "LEETCODE_CALENDAR_FRESH_SECONDS", 300))
+    return state, _calendar_years(start_year, state, fresh)
+
+@inflight.coalesce("calendar-ingest")
+def _refresh_calendar(username: str, start_year: int):
+    """
+    Pull the calendar from LeetCode into SubmissionDay: the recent years unless
+    we fetched them less than LEETCODE_CALENDAR_FRESH_SECONDS ago, plus any
+    year from `start_year` on that was never fetched completely. If LeetCode
+    fails and we already have rows, those are served as-is. Returns the
+    CalendarSync row.
+    """
+    state, years = _calendar_plan(username, start_year)
+    if not years:
+        return state
+    try:
+        raw, complete = _fetch_leetcode_calendar(username, years)
+        tried = date(years[0], 1, 1)
+        return submissions.ingest(username, raw, tried if complete else None, tried)
+    except Exception:
+        if state is None:
+            raise
+        return state
+
+CALENDAR_MEDIA_TYPE = "application/vnd.dsatracker.calendar+json"
+
+def _calendar_options(request) -> tuple:
+    """
+    (window length in days, compact encoding or None) for a calendar request.
 
+    ?days=N (1..LEETCODE_CALENDAR_MAX_DAYS) sets the window. The compact form
+    is chosen with ?format=compact[&encoding=list|rle|b64] or
+    Accept: application/vnd.dsatracker.calendar+json[; encoding=...].
+    """
+    days = _int_arg(request, "days", getattr(settings, "LEETCODE_CALENDAR_DAYS", 181),
+                    1, getattr(settings, "LEETCODE_CALENDAR_MAX_DAYS", 3660))
+    encoding = None
+    if request.GET.get("format") == "compact":
+        encoding = request.GET.get("encoding", "list")
+    else:
+        for media in request.headers.get("Accept", "").split(","):
+            mtype, *params = (p.strip() for p in media.split(";"))
+            if mtype.lower() == CALENDAR_MEDIA_TYPE:
+                params = dict(p.partition("=")[::2] for p in params)
+                encoding = params.get("encoding", "list").strip('"')
+                break
+    if encoding is not None and encoding not in heatmap.ENCODINGS:
+        encoding = "list"
+    return days, encoding
+
+def _window_start(length: int):
+    return datetime.now(timezone.utc).date() - timedelta(days=length - 1)
+
+def _calendar_etag(username: str, state, *variant) -> str:
+    # Stored days only change when fetched_at does; the window moves daily.
+    today = datetime.now(timezone.utc).date()
+    return make_etag("calendar", username.lower(), state.fetched_at, today, *variant)
+
+def _calendar_payload(username: str, state, length: int = None, encoding: str = None) -> dict:
+    """Response body for the calendar endpoints from stored days + streak state."""
+    length = length or getattr(settings, "LEETCODE_CALENDAR_DAYS", 181)
     today = datetime.now(timezone.utc).date()
-    start = min(datetime.fromisoformat(d).date() for d in day_counts.keys())
+    start = _window_start(length)
+    per_day = submissions.daily_counts(username, start, today)
+    streak = {
+        "currentStreak": streaks.current_streak(state.run_start, state.last_active, today),
+        "maxStreak": state.max_run,
+    }
+    if encoding is not None:
+        counts = heatmap.pack(per_day.items(), start, length)
+        return {
+            "start": start.isoformat(),
+            "length": length,
+            "encoding": encoding,
+            "counts": heatmap.encode(counts, encoding),
+            **streak,
+        }
 
-    cur = 0
-    mx = 0
+    days = []
     d = start
     while d <= today:
-        ds = d.isoformat()
-        if day_counts.get(ds, 0) > 0:
-            cur += 1
-            mx = max(mx, cur)
-        else:
-            cur = 0
+        days.append({"date": d.isoformat(), "count": per_day.get(d, 0)})
         d += timedelta(days=1)
+    return {"days": days, **streak}
 
-    # current streak: consecutive days ending today
-    cur_streak = 0
-    d = today
-    while day_counts.get(d.isoformat(), 0) > 0:
-        cur_streak += 1
-        d -= timedelta(days=1)
-
-    return cur_streak, mx
+def _vary_accept(response):
+    patch_vary_headers(response, ["Accept"])
+    return response
 
 @require_GET
 def leetcode_calendar(request, username: str):
     """
-    GET /api/problems/leetcode/<username>/calendar/
+    GET /api/problems/leetcode/<username>/calendar/[?days=N]
     -> { days: [{date, count}], currentStreak, maxStreak }
+    compact (see _calendar_options / heatmap.py):
+    -> { start, length, encoding, counts, currentStreak, maxStreak }
+
+    Reads the stored per-day counts (apps/problems/submissions.py), refreshing
+    them from LeetCode first when they are stale. Streaks come from the stored
+    aggregates, so maxStreak covers all ingested history, not just the window.
+    A window reaching into years not fetched yet fetches (and stores) them.
+    While LeetCode is unreachable stored days are served as-is, else 503.
+    ETag / Last-Modified follow the last fetch, so a 304 skips reading the days.
     """
+    days, encoding = _calendar_options(request)
     try:
-        raw = _fetch_leetcode_calendar(username)  # {unix_ts_str: count}
-
-        # Convert to per-day counts (UTC)
-        per_day = defaultdict(int)
-        for ts_str, cnt in (raw or {}).items():
-            try:
-                ts = int(ts_str)
-            except Exception:
-                continue
-            date_str = datetime.fromtimestamp(ts, tz=timezone.utc).date().isoformat()
-            per_day[date_str] += int(cnt or 0)
-
-        # Last 180 days
-        today = datetime.now(timezone.utc).date()
-        start = today - timedelta(days=180)
+        state = _refresh_calendar(username, _window_start(days).year)
+        return _vary_accept(conditional_response(
+            request,
+            lambda: JsonResponse(_calendar_payload(username, state, days, encoding), status=200),
+            etag=_calendar_etag(username, state, days, encoding),
+            last_modified=state.fetched_at,
+            max_age=_max_age(),
+        ))
+
+    except UpstreamUnavailable as e:
+        return _unavailable(e)
+    except requests.HTTPError as e:
+        return JsonResponse({"error": "calendar_failed", "detail": f"http {e}"}, status=502)
+    except Exception as e:
+        return JsonResponse({"error": "calendar_failed", "detail": str(e)}, status=502)
+
+
+@csrf_exempt
+@require_POST
+def leetcode_group_calendar(request):
+    """
+    POST /api/problems/leetcode/group/calendar/[?days=N]   { "usernames": [...] }
+    -> { days: [{date, count, active}], members, unknown: [usernames],
+         currentStreak, maxStreak, currentAllStreak, maxAllStreak }
+    compact (same options as leetcode_calendar):
+    -> { start, length, encoding, counts, active, members, unknown, ...streaks }
+
+    Combined heatmap of a study group from stored days only (no upstream
+    calls; members' days are refreshed by their own calendar requests):
+    count = the members' summed submissions, active = how many of them
+    submitted that day. Streaks are over the window: any member active
+    (current/maxStreak) and every synced member active (current/maxAllStreak).
+    `unknown` lists members whose calendar was never fetched; they have no
+    days and are left out of the "every member" streaks.
+    """
+    usernames = _body_usernames(request)
+    if isinstance(usernames, JsonResponse):
+        return usernames
+    if not usernames:
+        return JsonResponse({"error": "usernames must not be empty"}, status=400)
+    length, encoding = _calendar_options(request)
+    today = datetime.now(timezone.utc).date()
+    start = today - timedelta(days=length - 1)
+
+    keys = [submissions.user_key(u) for u in usernames]
+    known = submissions.synced_keys(keys)
+    rows = submissions.group_daily_counts(keys, start, today)  # [(date, total, active)]
+
+    anyone = [d.toordinal() for d, _, active in rows]
+    everyone = [d.toordinal() for d, _, active in rows if known and active == len(known)]
+    current, longest = streaks.streaks_from_ordinals(anyone, today.toordinal())
+    current_all, longest_all = streaks.streaks_from_ordinals(everyone, today.toordinal())
+    group = {
+        "members": len(keys),
+        "unknown": [u for u, k in zip(usernames, keys) if k not in known],
+        "currentStreak": current,
+        "maxStreak": longest,
+        "currentAllStreak": current_all,
+        "maxAllStreak": longest_all,
+    }
+
+    if encoding is not None:
+        body = {
+            "start": start.isoformat(),
+            "length": length,
+            "encoding": encoding,
+            "counts": heatmap.encode(heatmap.pack(((d, t) for d, t, _ in rows), start, length), encoding),
+            "active": heatmap.encode(heatmap.pack(((d, a) for d, _, a in rows), start, length), encoding),
+            **group,
+        }
+    else:
+        per_day = {d: (t, a) for d, t, a in rows}
         days = []
         d = start
         while d <= today:
-            ds = d.isoformat()
-            days.append({"date": ds, "count": per_day.get(ds, 0)})
+            total, active = per_day.get(d, (0, 0))
+            days.append({"date": d.isoformat(), "count": total, "active": active})
             d += timedelta(days=1)
+        body = {"days": days, **group}
+    return _vary_accept(JsonResponse(body, status=200))
 
-        streak_map = {x["date"]: x["count"] for x in days}
-        current_streak, max_streak = _calc_streaks_from_days(streak_map)
 
-        return JsonResponse({
-            "days": days,
-            "currentStreak": current_streak,
-            "maxStreak": max_streak,
-        }, status=200)
+# =========================
+# Problem SEARCH
+# =========================
 
-    except requests.HTTPError as e:
-        return JsonResponse({"error": "calendar_failed", "detail": f"http {e}"}, status=502)
-    except Exception as e:
-        return JsonResponse({"error": "calendar_failed", "detail": str(e)}, status=502)
+def _int_arg(request, name, default, lo, hi):
+    try:
+        value = int(request.GET.get(name, default))
+    except (TypeError, ValueError):
+        value = default
+    return max(lo, min(hi, value))
+
+def _list_arg(request, name):
+    """?name=a,b and/or ?name=a&name=b"""
+    return [v.strip() for raw in request.GET.getlist(name) for v in raw.split(",") if v.strip()]
+
+@require_GET
+def problem_search(request):
+    """
+    GET /api/problems/search/?q=<text>&difficulty=E,M&tag=array&tag=dp&after=<id>&limit=<n>
+    -> { results: [{id, title, slug, difficulty, tags, acceptance}], next: <id for ?after=> | null }
+
+    q: substring of the title (3+ chars) or prefix of a title word (1-2 chars).
+    Ordered by id; pages with the keyset cursor in `next`.
+    """
+    difficulties = {d[:1].upper() for d in _list_arg(request, "difficulty")}
+    limit = _int_arg(request, "limit", 20, 1, 100)
+    rows = search.search(
+        q=request.GET.get("q", ""),
+        difficulties=difficulties,
+        tags=_list_arg(request, "tag"),
+        after=_int_arg(request, "after", 0, 0, 2**63 - 1),
+        limit=limit + 1,
+    )
+    return JsonResponse({
+        "results": [r._asdict() for r in rows[:limit]],
+        "next": rows[limit - 1].id if len(rows) > limit else None,
+    })
+
+
+# =========================
+# Upstream STATUS (operators)
+# =========================
+
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+def leetcode_upstream_status(request):
+    """
+    GET /api/problems/leetcode/status/  (staff only)
+    -> { breakers: {endpoint: {state, recent_failures}},
+         coalescing: {sync: {upstream_calls, deduplicated, in_flight}, async: {...}} }
+
+    Counters are per worker process, since process start.
+    """
+    return Response({
+        "breakers": breaker.status(),
+        "coalescing": {
+            "sync": singleflight.leetcode.metrics(),
+            "async": singleflight.leetcode_async.metrics(),
+        },
+    })
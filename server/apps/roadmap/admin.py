@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Track, TrackProblem
+from .models import Track, TrackProblem, UserProblemProgress
 
 class TrackProblemInline(admin.TabularInline):
     model = TrackProblem
@@ -11,3 +11,8 @@ class TrackAdmin(admin.ModelAdmin):
     list_display = ("id", "name", "slug")
     prepopulated_fields = {"slug": ("name",)}
     inlines = [TrackProblemInline]
+
+@admin.register(UserProblemProgress)
+class UserProblemProgressAdmin(admin.ModelAdmin):
+    list_display = ("user", "problem", "completed_at")
+    list_select_related = ("user", "problem")
@@ -0,0 +1,126 @@
+# server/apps/roadmap/attach.py
+#
+# Set a track's problem list (TrackBulkAttachAPIView) by diffing it against the
+# stored rows instead of deleting and recreating all of them.
+#
+# TrackProblem.order is a sparse sort key (multiples of GAP), and the API
+# reports positions 1..N instead (serializers.PositionListSerializer), so:
+#   - rows of problems no longer listed are deleted
+#   - the longest run of kept rows that is already in the right relative
+#     order keeps its order values untouched
+#   - every other row (moved or new) gets a value between its neighbours;
+#     only when a gap is exhausted is the whole track renumbered
+#
+# Everything runs in one transaction with the track row locked, so readers
+# never see a half-applied list. Moved rows are first parked above every
+# order in use, so the (track, order) unique constraint holds after every
+# statement.
+
+from bisect import bisect_left
+
+from django.db import transaction
+
+from . import catalogue
+from . import signals
+from .models import Track, TrackProblem
+
+GAP = 1024
+MAX_ORDER = 2 ** 30  # stay well inside a 32-bit PositiveIntegerField
+
+
+def _longest_increasing(values: list) -> set:
+    """Indexes of one longest strictly increasing subsequence (None entries skipped)."""
+    tails, tails_at, prev = [], [], [None] * len(values)
+    for i, v in enumerate(values):
+        if v is None:
+            continue
+        j = bisect_left(tails, v)
+        if j == len(tails):
+            tails.append(v)
+            tails_at.append(i)
+        else:
+            tails[j] = v
+            tails_at[j] = i
+        prev[i] = tails_at[j - 1] if j else None
+    keep = set()
+    i = tails_at[-1] if tails_at else None
+    while i is not None:
+        keep.add(i)
+        i = prev[i]
+    return keep
+
+
+def _plan(current: list) -> list:
+    """
+    Target order for each position, given current[i] = the existing order of
+    the problem now at position i (None for new ones). Returns None when some
+    gap is too small and the track has to be renumbered.
+    """
+    keep = _longest_increasing(current)
+    target = [current[i] if i in keep else None for i in range(len(current))]
+    i = 0
+    while i < len(target):
+        if target[i] is not None:
+            i += 1
+            continue
+        j = i
+        while j < len(target) and target[j] is None:
+            j += 1
+        lo = target[i - 1] if i else 0
+        count = j - i
+        if j < len(target):
+            step = (target[j] - lo) // (count + 1)
+            if step < 1:
+                return None
+        else:
+            step = GAP
+        for k in range(count):
+            target[i + k] = lo + step * (k + 1)
+        i = j
+    if target and target[-1] > MAX_ORDER:
+        return None
+    return target
+
+
+def attach(track_id: int, problem_ids: list) -> dict:
+    """
+    Make the track's problems exactly `problem_ids`, in that order.
+    Ids must be distinct, existing problems. Returns row counts per kind of change.
+    """
+    with transaction.atomic(), signals.batched():
+        Track.objects.select_for_update().filter(pk=track_id).first()
+        rows = {pid: (pk, order) for pk, pid, order in
+                TrackProblem.objects.filter(track_id=track_id).values_list('pk', 'problem_id', 'order')}
+
+        wanted = set(problem_ids)
+        gone = [pk for pid, (pk, _) in rows.items() if pid not in wanted]
+        if gone:
+            TrackProblem.objects.filter(pk__in=gone).delete()
+
+        current = [rows[pid][1] if pid in rows else None for pid in problem_ids]
+        target = _plan(current)
+        if target is None:
+            target = [GAP * (i + 1) for i in range(len(problem_ids))]
+
+        moved = [TrackProblem(pk=rows[pid][0], order=order)
+                 for pid, old, order in zip(problem_ids, current, target)
+                 if old is not None and old != order]
+        if moved:
+            park = max([o for _, o in rows.values()] + target) + 1
+            parked = [TrackProblem(pk=tp.pk, order=park + i) for i, tp in enumerate(moved)]
+            TrackProblem.objects.bulk_update(parked, ['order'], batch_size=500)
+            TrackProblem.objects.bulk_update(moved, ['order'], batch_size=500)
+
+        new = [TrackProblem(track_id=track_id, problem_id=pid, order=order)
+               for pid, old, order in zip(problem_ids, current, target) if old is None]
+        TrackProblem.objects.bulk_create(new, batch_size=500)
+
+        if gone or moved or new:
+            Track.touch(pk=track_id)  # cursors rebuild against the new positions
+            catalogue.bump()
+    return {
+        "attached": len(problem_ids),
+        "inserted": len(new),
+        "deleted": len(gone),
+        "moved": len(moved),
+    }
@@ -0,0 +1,161 @@
+# server/apps/roadmap/catalogue.py
+#
+# Pre-rendered JSON for the track list / track detail endpoints.
+#
+# Tracks only change through the admin or the attach endpoint, so the fully
+# serialized bodies are kept in the ROADMAP_CACHE_ALIAS cache under a
+# catalogue version:
+#
+#   roadmap:version                    -> int, bumped by signals.py on any
+#                                         Track / TrackProblem / Problem write
+#   roadmap:v<version>:tracks          -> Entry for GET /api/tracks/
+#   roadmap:v<version>:summaries       -> Entry for GET /api/tracks/?view=summary
+#   roadmap:v<version>:track:<pk>      -> Entry for GET /api/tracks/<pk>/
+#   roadmap:v<version>:order:<pk>      -> TrackOrder (problems by position,
+#                                         used by cursors.py / suggest-next)
+#   roadmap:v<version>:progress:<uid>  -> per-track completion for one user
+#                                         (progress.py); dropped on their writes
+#
+# A bump makes every old key unreachable (they expire after ROADMAP_CACHE_TTL),
+# so readers never see a stale body and nothing has to be deleted. The TTL also
+# bounds staleness if the cache isn't shared between workers (locmem).
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models import Max
+from django.http import HttpResponse
+
+from apps.problems.conditional import content_etag
+from .models import Track, TrackProblem
+from .serializers import render_json, track_dicts, track_summaries
+
+VERSION_KEY = "roadmap:version"
+
+
+@dataclass(frozen=True)
+class Entry:
+    body: bytes
+    etag: str
+    last_modified: datetime = None
+
+    def response(self) -> HttpResponse:
+        return HttpResponse(self.body, content_type="application/json")
+
+
+@dataclass(frozen=True)
+class TrackOrder:
+    updated_at: datetime
+    problems: tuple      # ((problem_id, title), ...) by order
+    positions: dict      # problem_id -> index into problems
+
+    def suggestion(self, position: int) -> dict:
+        pid, title = self.problems[position]
+        return {"id": pid, "title": title, "order": position + 1}
+
+
+def _cache():
+    return caches[getattr(settings, "ROADMAP_CACHE_ALIAS", "roadmap")]
+
+
+def _ttl() -> int:
+    return getattr(settings, "ROADMAP_CACHE_TTL", 300)
+
+
+def version() -> int:
+    v = _cache().get(VERSION_KEY)
+    if v is None:
+        _cache().add(VERSION_KEY, 1, timeout=None)
+        v = _cache().get(VERSION_KEY, 1)
+    return v
+
+
+def _incr() -> None:
+    try:
+        _cache().incr(VERSION_KEY)
+    except ValueError:  # not set yet (or evicted): any fresh value invalidates
+        _cache().add(VERSION_KEY, 1, timeout=None)
+        _cache().incr(VERSION_KEY)
+
+
+def bump() -> None:
+    """New catalogue version once the current transaction (if any) commits."""
+    # bumping earlier would let a concurrent reader cache the pre-commit rows
+    # under the new version
+    transaction.on_commit(_incr)
+
+
+def _get_or_build(key: str, build):
+    # version is read by the caller *before* building, so a write racing with
+    # the render lands under the old version and is never served as current
+    entry = _cache().get(key)
+    if entry is None:
+        entry = build()
+        if entry is not None:
+            _cache().set(key, entry, _ttl())
+    return entry
+
+
+def track_list() -> Entry:
+    def build():
+        tracks = Track.objects.order_by("id")
+        body = render_json(track_dicts(tracks))
+        last = tracks.aggregate(last=Max("updated_at"))["last"]
+        return Entry(body, content_etag(body), last)
+
+    return _get_or_build(f"roadmap:v{version()}:tracks", build)
+
+
+def track_summary_list() -> Entry:
+    def build():
+        tracks = Track.objects.order_by("id")
+        body = render_json(track_summaries(tracks))
+        last = tracks.aggregate(last=Max("updated_at"))["last"]
+        return Entry(body, content_etag(body), last)
+
+    return _get_or_build(f"roadmap:v{version()}:summaries", build)
+
+
+def track_detail(pk: int):
+    """Entry for one track, or None if it doesn't exist."""
+    def build():
+        found = track_dicts(Track.objects.filter(pk=pk))
+        if not found:
+            return None
+        body = render_json(found[0])
+        updated = Track.objects.filter(pk=pk).values_list("updated_at", flat=True).first()
+        return Entry(body, content_etag(body), updated)
+
+    return _get_or_build(f"roadmap:v{version()}:track:{pk}", build)
+
+
+def track_order(pk: int):
+    """TrackOrder for one track, or None if it doesn't exist."""
+    def build():
+        updated = Track.objects.filter(pk=pk).values_list("updated_at", flat=True).first()
+        if updated is None:
+            return None
+        problems = tuple(
+            TrackProblem.objects
+            .filter(track_id=pk)
+            .order_by("order")
+            .values_list("problem_id", "problem__title")
+        )
+        return TrackOrder(updated, problems, {p[0]: i for i, p in enumerate(problems)})
+
+    return _get_or_build(f"roadmap:v{version()}:order:{pk}", build)
+
+
+def _progress_key(user_id: int) -> str:
+    return f"roadmap:v{version()}:progress:{user_id}"
+
+
+def user_progress(user_id: int, build):
+    return _get_or_build(_progress_key(user_id), build)
+
+
+def forget_user_progress(user_id: int) -> None:
+    transaction.on_commit(lambda: _cache().delete(_progress_key(user_id)))
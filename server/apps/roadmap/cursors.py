@@ -0,0 +1,163 @@
+# server/apps/roadmap/cursors.py
+#
+# Per-(user, track) completion cursors (TrackCursor) behind suggest-next.
+#
+# A cursor is a bitset over track positions (bit i = i-th problem by order)
+# plus the first unset position and the popcount. Position -> problem comes
+# from catalogue.track_order(), which is cached, so answering suggest-next is
+# one indexed cursor lookup:
+#   next N     -> walk unset bits from next_position
+#   percent    -> done_count / len(track)
+#
+# progress.mark()/unmark() flip the bits of cursors that already exist (in the
+# same transaction). A cursor is (re)built from UserProblemProgress when it is
+# first read, or when its track_stamp no longer matches Track.updated_at, i.e.
+# after the track's problems were attached, removed or reordered.
+
+from django.db import transaction
+from django.db.models import Subquery
+
+from . import catalogue
+from .models import TrackCursor, TrackProblem, UserProblemProgress
+
+
+def _to_int(done) -> int:
+    return int.from_bytes(bytes(done or b""), "little")
+
+
+def _to_bytes(bits: int) -> bytes:
+    return bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+
+
+def first_unset(bits: int, start: int = 0) -> int:
+    x = bits >> start
+    return start + ((~x & (x + 1)).bit_length() - 1)
+
+
+def _set_bits(cursor: TrackCursor, bits: int) -> None:
+    cursor.done = _to_bytes(bits)
+    cursor.done_count = bits.bit_count()
+    cursor.next_position = first_unset(bits)
+
+
+def lock_progress(user) -> None:
+    """
+    Serialize progress writes and cursor rebuilds for one user (inside a
+    transaction): a rebuild then reads progress either after a concurrent
+    mark()/unmark() committed, or before it, in which case the write's
+    apply() finds the rebuilt cursor and flips its bits.
+    """
+    type(user).objects.select_for_update().filter(pk=user.pk).values_list("pk", flat=True).first()
+
+
+def rebuild(user, track_id: int, order) -> TrackCursor:
+    TrackCursor.objects.get_or_create(user=user, track_id=track_id)
+    with transaction.atomic():
+        lock_progress(user)
+        cursor = TrackCursor.objects.select_for_update().get(user=user, track_id=track_id)
+        done = (UserProblemProgress.objects
+                .filter(user=user, problem__trackproblem__track_id=track_id)
+                .values_list("problem_id", flat=True))
+        bits = 0
+        for pid in done:
+            if pid in order.positions:
+                bits |= 1 << order.positions[pid]
+        _set_bits(cursor, bits)
+        cursor.track_stamp = order.updated_at
+        cursor.save(update_fields=["done", "done_count", "next_position", "track_stamp"])
+    return cursor
+
+
+def get(user, track_id: int):
+    """(cursor, TrackOrder) for a user and track; (None, None) if the track doesn't exist."""
+    order = catalogue.track_order(track_id)
+    if order is None:
+        return None, None
+    cursor = TrackCursor.objects.filter(user=user, track_id=track_id).first()
+    if cursor is None or cursor.track_stamp != order.updated_at:
+        cursor = rebuild(user, track_id, order)
+    return cursor, order
+
+
+def apply(user, problem_ids, completed: bool) -> None:
+    """
+    Flip the given problems in the user's existing cursors. Call inside the
+    transaction that writes UserProblemProgress.
+    """
+    tracks = TrackProblem.objects.filter(problem_id__in=problem_ids).values("track_id")
+    rows = list(
+        TrackCursor.objects
+        .select_for_update()
+        .filter(user=user, track_id__in=Subquery(tracks))
+    )
+    changed = []
+    for cursor in rows:
+        order = catalogue.track_order(cursor.track_id)
+        if order is None or cursor.track_stamp != order.updated_at:
+            continue  # rebuilt from progress on next read
+        bits = _to_int(cursor.done)
+        for pid in problem_ids:
+            pos = order.positions.get(pid)
+            if pos is None:
+                continue
+            if completed:
+                bits |= 1 << pos
+            else:
+                bits &= ~(1 << pos)
+        _set_bits(cursor, bits)
+        changed.append(cursor)
+    TrackCursor.objects.bulk_update(changed, ["done", "done_count", "next_position"])
+
+
+def suggestions(order, is_done, start: int = 0, limit: int = 1) -> list:
+    """Up to `limit` not-done problems from position `start`, as suggestion dicts."""
+    out = []
+    for pos in range(start, len(order.problems)):
+        if not is_done(pos):
+            out.append(order.suggestion(pos))
+            if len(out) == limit:
+                break
+    return out
+
+
+def summary(order, done_count: int, upcoming: list) -> dict:
+    total = len(order.problems)
+    return {
+        "next": upcoming[0] if upcoming else None,
+        "upcoming": upcoming,
+        "completed": done_count,
+        "total": total,
+        "percent": round(100 * done_count / total, 1) if total else 0.0,
+    }
+
+
+def for_user(user, track_id: int, limit: int = 1, extra_ids=()):
+    """
+    suggest-next payload from the user's cursor, or None if the track doesn't
+    exist. `extra_ids` (client-supplied completed ids) count as done too,
+    without being stored.
+    """
+    cursor, order = get(user, track_id)
+    if cursor is None:
+        return None
+    bits = _to_int(cursor.done)
+    start, done_count = cursor.next_position, cursor.done_count
+    extra = 0
+    for pid in extra_ids:
+        if pid in order.positions:
+            extra |= 1 << order.positions[pid]
+    if extra & ~bits:
+        bits |= extra
+        start, done_count = first_unset(bits), bits.bit_count()
+    upcoming = suggestions(order, lambda pos: bits >> pos & 1, start, limit)
+    return summary(order, done_count, upcoming)
+
+
+def for_ids(done_ids, track_id: int, limit: int = 1):
+    """Same payload for a client-supplied set of completed problem ids (anonymous users)."""
+    order = catalogue.track_order(track_id)
+    if order is None:
+        return None
+    done_positions = {order.positions[pid] for pid in done_ids if pid in order.positions}
+    upcoming = suggestions(order, done_positions.__contains__, 0, limit)
+    return summary(order, len(done_positions), upcoming)
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-18 17:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("roadmap", "0002_seed_tracks"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="track",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.6 on 2026-10-18 17:33
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("problems", "0003_calendar_streak_state"),
+        ("roadmap", "0003_track_updated_at"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserProblemProgress",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("completed_at", models.DateTimeField(auto_now_add=True)),
+                ("problem", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to="problems.problem")),
+                ("user", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="problem_progress", to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                "constraints": [models.UniqueConstraint(fields=("user", "problem"), name="uniq_user_problem_progress")],
+            },
+        ),
+    ]
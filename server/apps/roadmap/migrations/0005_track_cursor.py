@@ -0,0 +1,31 @@
+# Generated by Django 5.2.6 on 2026-10-18 17:34
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("roadmap", "0004_user_problem_progress"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TrackCursor",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("done", models.BinaryField(default=bytes)),
+                ("done_count", models.PositiveIntegerField(default=0)),
+                ("next_position", models.PositiveIntegerField(default=0)),
+                ("track_stamp", models.DateTimeField(null=True)),
+                ("track", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="cursors", to="roadmap.track")),
+                ("user", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="track_cursors", to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                "constraints": [models.UniqueConstraint(fields=("user", "track"), name="uniq_user_track_cursor")],
+            },
+        ),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 from django.utils.text import slugify
 
 
@@ -6,6 +7,9 @@ class Track(models.Model):
     name = models.CharField(max_length=120, unique=True)
     description = models.TextField(blank=True)
     slug = models.SlugField(max_length=140, unique=True, blank=True)
+    # bumped on any change to the track or its problems (see signals.py);
+    # drives ETag / Last-Modified on the track endpoints
+    updated_at = models.DateTimeField(auto_now=True)
 
     def save(self, *args, **kwargs):
         if not self.slug:
@@ -15,6 +19,11 @@ class Track(models.Model):
     def __str__(self):
         return self.name
 
+    @classmethod
+    def touch(cls, **filters):
+        """Mark matching tracks as modified without loading them."""
+        cls.objects.filter(**filters).update(updated_at=timezone.now())
+
 
 class TrackProblem(models.Model):
     track = models.ForeignKey(
@@ -29,3 +38,45 @@ class TrackProblem(models.Model):
 
     def __str__(self):
         return f"{self.track.name} - {self.problem.title}"
+
+
+class UserProblemProgress(models.Model):
+    """A problem a user has marked as completed (one row per user/problem)."""
+    user = models.ForeignKey(
+        'auth.User', on_delete=models.CASCADE, related_name='problem_progress'
+    )
+    problem = models.ForeignKey('problems.Problem', on_delete=models.CASCADE)
+    completed_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            # also the index suggest-next probes per track problem
+            models.UniqueConstraint(fields=['user', 'problem'], name='uniq_user_problem_progress'),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} - {self.problem_id}"
+
+
+class TrackCursor(models.Model):
+    """
+    A user's completed positions in one track, as a bitset (see cursors.py).
+    Position i is the i-th TrackProblem by order as of track_stamp; a cursor
+    whose stamp no longer matches Track.updated_at is rebuilt on next read.
+    """
+    user = models.ForeignKey(
+        'auth.User', on_delete=models.CASCADE, related_name='track_cursors'
+    )
+    track = models.ForeignKey('roadmap.Track', on_delete=models.CASCADE, related_name='cursors')
+    done = models.BinaryField(default=bytes)                   # little-endian bitset
+    done_count = models.PositiveIntegerField(default=0)
+    next_position = models.PositiveIntegerField(default=0)    # first position not done
+    track_stamp = models.DateTimeField(null=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'track'], name='uniq_user_track_cursor'),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} - {self.track_id} ({self.done_count})"
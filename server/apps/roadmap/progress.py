@@ -0,0 +1,77 @@
+# server/apps/roadmap/progress.py
+#
+# Stored per-user progress (UserProblemProgress). Writes also update the
+# user's track cursors (cursors.py) in the same transaction, which is what
+# suggest-next reads, and drop their cached per-track summary.
+
+from django.db import transaction
+from django.db.models import Count, Exists, OuterRef, Q
+
+from apps.problems.models import Problem
+from . import catalogue
+from . import cursors
+from .models import Track, UserProblemProgress
+
+
+def valid_problem_ids(ids) -> list:
+    """The given ids that exist, in one query (order kept, duplicates dropped)."""
+    wanted = list(dict.fromkeys(ids))
+    found = set(Problem.objects.filter(pk__in=wanted).values_list('pk', flat=True))
+    return [pid for pid in wanted if pid in found]
+
+
+def mark(user, problem_ids) -> int:
+    """Mark problems completed; already-completed ones are left alone. Returns rows added."""
+    ids = valid_problem_ids(problem_ids)
+    with transaction.atomic():
+        cursors.lock_progress(user)
+        before = UserProblemProgress.objects.filter(user=user, problem_id__in=ids).count()
+        UserProblemProgress.objects.bulk_create(
+            [UserProblemProgress(user=user, problem_id=pid) for pid in ids],
+            ignore_conflicts=True,
+        )
+        cursors.apply(user, ids, completed=True)
+        catalogue.forget_user_progress(user.pk)
+    return len(ids) - before
+
+
+def unmark(user, problem_ids) -> int:
+    """Remove completions. Returns rows removed."""
+    ids = list(problem_ids)
+    with transaction.atomic():
+        cursors.lock_progress(user)
+        deleted, _ = UserProblemProgress.objects.filter(user=user, problem_id__in=ids).delete()
+        cursors.apply(user, ids, completed=False)
+        catalogue.forget_user_progress(user.pk)
+    return deleted
+
+
+def completed_ids(user, track_id=None) -> list:
+    qs = UserProblemProgress.objects.filter(user=user)
+    if track_id is not None:
+        qs = qs.filter(problem__trackproblem__track_id=track_id)
+    return list(qs.order_by('problem_id').values_list('problem_id', flat=True))
+
+
+def track_summary(user) -> list:
+    """
+    [{id, completed, total, percent}] for every track, from one grouped query
+    (track problems counted, and counted again where the user has a progress
+    row), cached per user until they mark/unmark or a track changes.
+    """
+    def build():
+        done = UserProblemProgress.objects.filter(
+            user=user, problem_id=OuterRef('track_problems__problem_id')
+        )
+        rows = (Track.objects
+                .order_by('id')
+                .annotate(total=Count('track_problems'),
+                          completed=Count('track_problems', filter=Q(Exists(done))))
+                .values_list('id', 'completed', 'total'))
+        return [
+            {"id": pk, "completed": completed, "total": total,
+             "percent": round(100 * completed / total, 1) if total else 0.0}
+            for pk, completed, total in rows
+        ]
+
+    return catalogue.user_progress(user.pk, build)
@@ -1,18 +1,38 @@
+import json
+
+from django.db.models import Count, Q
 from rest_framework import serializers
 from .models import Track, TrackProblem
 from apps.problems.models import Problem
 
+try:
+    import orjson
+except ImportError:  # optional; falls back to the stdlib encoder
+    orjson = None
+
 class ProblemSerializer(serializers.ModelSerializer):
     class Meta:
         model = Problem
         fields = ['id', 'title', 'difficulty']
 
+class PositionListSerializer(serializers.ListSerializer):
+    """
+    Outputs `order` as the 1-based position in the track: the stored column
+    is a sparse sort key (see attach.py), clients show it as #N.
+    """
+    def to_representation(self, data):
+        rows = super().to_representation(data)
+        for position, row in enumerate(rows, 1):
+            row['order'] = position
+        return rows
+
 class TrackProblemSerializer(serializers.ModelSerializer):
     problem = ProblemSerializer(read_only=True)
 
     class Meta:
         model = TrackProblem
         fields = ['order', 'problem']
+        list_serializer_class = PositionListSerializer
 
 class TrackSerializer(serializers.ModelSerializer):
     track_problems = TrackProblemSerializer(many=True, read_only=True)
@@ -20,3 +40,74 @@ class TrackSerializer(serializers.ModelSerializer):
     class Meta:
         model = Track
         fields = ['id', 'name', 'description', 'slug', 'track_problems']
+
+
+# ---- fast path for read-only output (see catalogue.py / bench_tracks.py) ----
+#
+# Same shape as TrackSerializer, built from two values_list() queries into
+# plain dicts: no model instances, no per-field serializer calls.
+
+TRACK_FIELDS = ('id', 'name', 'description', 'slug')
+
+
+def track_dicts(tracks) -> list:
+    """TrackSerializer(many=True).data equivalent for a Track queryset."""
+    out = [dict(zip(TRACK_FIELDS, row)) for row in tracks.values_list(*TRACK_FIELDS)]
+    by_id = {}
+    for t in out:
+        t['track_problems'] = by_id[t['id']] = []
+    rows = (TrackProblem.objects
+            .filter(track_id__in=by_id)
+            .order_by('track_id', 'order')
+            .values_list('track_id', 'problem_id', 'problem__title', 'problem__difficulty'))
+    for track_id, pid, title, difficulty in rows:
+        problems = by_id[track_id]
+        problems.append(
+            {'order': len(problems) + 1, 'problem': {'id': pid, 'title': title, 'difficulty': difficulty}}
+        )
+    return out
+
+
+def track_summaries(tracks) -> list:
+    """
+    Track cards without the nested problem list: problem count and a
+    difficulty histogram, from one annotated (grouped) query.
+    """
+    counts = {
+        code.lower(): Count('track_problems', filter=Q(track_problems__problem__difficulty=code))
+        for code, _ in Problem.DIFFICULTY
+    }
+    rows = (tracks
+            .annotate(problem_count=Count('track_problems'), **counts)
+            .values(*TRACK_FIELDS, 'problem_count', *counts))
+    return [
+        {**{f: row[f] for f in TRACK_FIELDS},
+         'problem_count': row['problem_count'],
+         'difficulty': {code: row[code.lower()] for code, _ in Problem.DIFFICULTY}}
+        for row in rows
+    ]
+
+
+def track_problem_page(track_id, after_order=None, after_position=0, limit=50) -> list:
+    """
+    Up to `limit` entries of one track after a keyset position, shaped like
+    TrackSerializer's track_problems items, plus the stored sort key of each
+    (for the next cursor): [(order, item), ...].
+    """
+    qs = TrackProblem.objects.filter(track_id=track_id)
+    if after_order is not None:
+        qs = qs.filter(order__gt=after_order)
+    rows = (qs.order_by('order')
+            .values_list('order', 'problem_id', 'problem__title', 'problem__difficulty')[:limit])
+    return [
+        (order, {'order': after_position + i,
+                 'problem': {'id': pid, 'title': title, 'difficulty': difficulty}})
+        for i, (order, pid, title, difficulty) in enumerate(rows, 1)
+    ]
+
+
+def render_json(data) -> bytes:
+    """Compact UTF-8 JSON, like DRF's JSONRenderer output."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode()
@@ -0,0 +1,61 @@
+# server/apps/roadmap/signals.py
+#
+# Keep Track.updated_at current when a track's problem list or one of its
+# problems changes (Track.save() bumps it by itself via auto_now), and bump the
+# pre-rendered catalogue version (catalogue.py) on any of these writes; Track
+# writes also drop this process's slug map (slugs.py).
+# QuerySet.bulk_create() / update() send no signals: callers touch the track
+# and bump the catalogue themselves (see attach.py), and wrap their deletes in
+# batched() so the per-row receivers don't fire once per deleted row.
+
+import threading
+from contextlib import contextmanager
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.problems.models import Problem
+from . import catalogue
+from . import slugs
+from .models import Track, TrackProblem
+
+
+_local = threading.local()
+
+
+@contextmanager
+def batched():
+    """Mute the receivers below; the caller touches / bumps once at the end."""
+    _local.muted = getattr(_local, "muted", 0) + 1
+    try:
+        yield
+    finally:
+        _local.muted -= 1
+
+
+def _muted() -> bool:
+    return getattr(_local, "muted", 0) > 0
+
+
+@receiver([post_save, post_delete], sender=Track)
+def track_changed(sender, instance, **kwargs):
+    transaction.on_commit(slugs.invalidate)
+    if not _muted():
+        catalogue.bump()
+
+
+@receiver([post_save, post_delete], sender=TrackProblem)
+def track_problem_changed(sender, instance, **kwargs):
+    if _muted():
+        return
+    Track.touch(pk=instance.track_id)
+    catalogue.bump()
+
+
+@receiver([post_save, post_delete], sender=Problem)
+def problem_changed(sender, instance, **kwargs):
+    if _muted():
+        return
+    Track.touch(track_problems__problem=instance)
+    catalogue.bump()
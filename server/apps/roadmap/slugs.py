@@ -0,0 +1,56 @@
+# server/apps/roadmap/slugs.py
+#
+# Track slug -> pk for the slug routes (/api/tracks/<slug>/...), so resolving a
+# human-readable URL doesn't cost a query.
+#
+# Each process keeps the whole map (tracks are few). signals.py drops it when
+# a Track is saved or deleted here; other processes notice through the
+# catalogue version (catalogue.py), which the same writes bump. The version
+# lives in the roadmap cache (a network hop with a shared backend), so it is
+# checked at most every ROADMAP_SLUG_RECHECK seconds: a hot lookup is a dict
+# read, and another worker's slug change shows up within that delay.
+#
+# The map is loaded by the first lookup rather than in AppConfig.ready():
+# Django runs ready() for every management command too (including migrate on
+# an empty database), and warns about queries made there.
+
+import threading
+import time
+
+from django.conf import settings
+
+from . import catalogue
+from .models import Track
+
+_lock = threading.Lock()
+_map = None
+_version = None
+_checked_at = 0.0
+
+
+def _load() -> None:
+    global _map, _version
+    version = catalogue.version()  # read first: a racing write leaves us outdated, not wrong
+    _map = dict(Track.objects.values_list("slug", "pk"))
+    _version = version
+
+
+def resolve(slug: str):
+    """pk of the track with this slug, or None."""
+    global _checked_at
+    with _lock:
+        now = time.monotonic()
+        if _map is None:
+            _load()
+            _checked_at = now
+        elif now - _checked_at >= getattr(settings, "ROADMAP_SLUG_RECHECK", 5):
+            _checked_at = now
+            if _version != catalogue.version():
+                _load()
+        return _map.get(slug)
+
+
+def invalidate() -> None:
+    global _map
+    with _lock:
+        _map = None
@@ -1,3 +1,212 @@
-from django.test import TestCase
+import random
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.test import SimpleTestCase, TestCase
+
+from apps.problems.models import Problem
+from . import cursors, progress
+from .attach import GAP, _longest_increasing, _plan, attach
+from .models import Track, TrackCursor, TrackProblem
+
+
+class LongestIncreasingTests(SimpleTestCase):
+    def test_empty(self):
+        self.assertEqual(_longest_increasing([]), set())
+
+    def test_already_sorted_keeps_everything(self):
+        self.assertEqual(_longest_increasing([1, 2, 3]), {0, 1, 2})
+
+    def test_skips_new_entries(self):
+        self.assertEqual(_longest_increasing([None, 10, None, 20]), {1, 3})
+
+    def test_one_moved_row(self):
+        # moving the last problem to the front only displaces that one row
+        self.assertEqual(_longest_increasing([30, 10, 20]), {1, 2})
+
+    def test_result_is_increasing_and_longest(self):
+        rng = random.Random(19)
+        for _ in range(200):
+            values = rng.sample(range(100), rng.randint(0, 12))
+            keep = sorted(_longest_increasing(values))
+            picked = [values[i] for i in keep]
+            self.assertEqual(picked, sorted(picked))
+            self.assertEqual(len(keep), self._brute_force(values))
+
+    @staticmethod
+    def _brute_force(values):
+        best = [1] * len(values)
+        for i in range(len(values)):
+            for j in range(i):
+                if values[j] < values[i]:
+                    best[i] = max(best[i], best[j] + 1)
+        return max(best, default=0)
+
+
+class PlanTests(SimpleTestCase):
+    def test_unchanged_list_keeps_orders(self):
+        self.assertEqual(_plan([GAP, 2 * GAP, 3 * GAP]), [GAP, 2 * GAP, 3 * GAP])
+
+    def test_append(self):
+        self.assertEqual(_plan([GAP, None, None]), [GAP, 2 * GAP, 3 * GAP])
+
+    def test_insert_between(self):
+        self.assertEqual(_plan([GAP, None, 2 * GAP]), [GAP, GAP + GAP // 2, 2 * GAP])
+
+    def test_insert_before_first(self):
+        self.assertEqual(_plan([None, GAP]), [GAP // 2, GAP])
+
+    def test_reorder_moves_only_displaced_row(self):
+        self.assertEqual(_plan([3 * GAP, GAP, 2 * GAP]), [GAP // 2, GAP, 2 * GAP])
+
+    def test_gap_exhausted(self):
+        self.assertIsNone(_plan([1, None, 2]))
+        self.assertIsNone(_plan([None, 1]))
+
+
+class TrackTestCase(TestCase):
+    def setUp(self):
+        caches[settings.ROADMAP_CACHE_ALIAS].clear()
+        self.track = Track.objects.create(name="Arrays")
+        self.problems = [Problem.objects.create(title=f"Problem {i}") for i in range(8)]
+
+    def ids(self, *indexes):
+        return [self.problems[i].pk for i in indexes]
+
+    def attach(self, *indexes):
+        # run the on-commit catalogue bump, as a real request would
+        with self.captureOnCommitCallbacks(execute=True):
+            attach(self.track.pk, self.ids(*indexes))
+
+
+class AttachTests(TrackTestCase):
+    def rows(self):
+        return list(TrackProblem.objects.filter(track=self.track)
+                    .order_by("order").values_list("problem_id", "order"))
+
+    def assertAttached(self, problem_ids):
+        rows = self.rows()
+        self.assertEqual([pid for pid, _ in rows], problem_ids)
+        orders = [order for _, order in rows]
+        self.assertEqual(len(set(orders)), len(orders))
+
+    def test_initial_attach(self):
+        result = attach(self.track.pk, self.ids(0, 1, 2))
+        self.assertEqual(result, {"attached": 3, "inserted": 3, "deleted": 0, "moved": 0})
+        self.assertEqual([o for _, o in self.rows()], [GAP, 2 * GAP, 3 * GAP])
+
+    def test_same_list_is_a_no_op(self):
+        attach(self.track.pk, self.ids(0, 1, 2))
+        result = attach(self.track.pk, self.ids(0, 1, 2))
+        self.assertEqual(result, {"attached": 3, "inserted": 0, "deleted": 0, "moved": 0})
+
+    def test_reorder(self):
+        attach(self.track.pk, self.ids(0, 1, 2, 3))
+        result = attach(self.track.pk, self.ids(3, 0, 1, 2))
+        self.assertEqual(result["moved"], 1)
+        self.assertAttached(self.ids(3, 0, 1, 2))
+
+    def test_swap(self):
+        attach(self.track.pk, self.ids(0, 1, 2, 3))
+        attach(self.track.pk, self.ids(0, 2, 1, 3))
+        self.assertAttached(self.ids(0, 2, 1, 3))
+
+    def test_insert_between_and_delete(self):
+        attach(self.track.pk, self.ids(0, 1, 2))
+        result = attach(self.track.pk, self.ids(0, 4, 2))
+        self.assertEqual(result, {"attached": 3, "inserted": 1, "deleted": 1, "moved": 0})
+        self.assertAttached(self.ids(0, 4, 2))
+        self.assertEqual(self.rows()[0][1], GAP)  # kept rows keep their order
+
+    def test_gap_exhausted_renumbers(self):
+        attach(self.track.pk, self.ids(0, 1))
+        TrackProblem.objects.filter(track=self.track, problem_id=self.problems[0].pk).update(order=1)
+        TrackProblem.objects.filter(track=self.track, problem_id=self.problems[1].pk).update(order=2)
+        attach(self.track.pk, self.ids(0, 5, 1))
+        self.assertAttached(self.ids(0, 5, 1))
+        self.assertEqual([o for _, o in self.rows()], [GAP, 2 * GAP, 3 * GAP])
+
+    def test_random_edits_keep_order_unique(self):
+        rng = random.Random(7)
+        pool = [p.pk for p in self.problems]
+        for _ in range(40):
+            wanted = rng.sample(pool, rng.randint(0, len(pool)))
+            attach(self.track.pk, wanted)
+            self.assertAttached(wanted)
+
+    def test_empty_list_detaches_everything(self):
+        attach(self.track.pk, self.ids(0, 1))
+        attach(self.track.pk, [])
+        self.assertEqual(self.rows(), [])
+
+
+class CursorTests(TrackTestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = User.objects.create(username="alice")
+        self.attach(0, 1, 2, 3)
+        cursors.get(self.user, self.track.pk)  # build the cursor up front
+
+    def cursor(self):
+        return TrackCursor.objects.get(user=self.user, track=self.track)
+
+    def mark(self, *indexes):
+        with self.captureOnCommitCallbacks(execute=True):
+            progress.mark(self.user, self.ids(*indexes))
+
+    def unmark(self, *indexes):
+        with self.captureOnCommitCallbacks(execute=True):
+            progress.unmark(self.user, self.ids(*indexes))
+
+    def suggest(self, limit=1, extra=()):
+        return cursors.for_user(self.user, self.track.pk, limit, self.ids(*extra))
+
+    def test_mark_and_unmark_flip_bits(self):
+        stamp = self.cursor().track_stamp
+        self.mark(1)
+        cursor = self.cursor()
+        self.assertEqual((cursor.done_count, cursor.next_position), (1, 0))
+        self.assertEqual(cursors._to_int(cursor.done), 0b10)
+
+        self.mark(0, 1)
+        cursor = self.cursor()
+        self.assertEqual((cursor.done_count, cursor.next_position), (2, 2))
+        self.assertEqual(cursors._to_int(cursor.done), 0b11)
+
+        self.unmark(0)
+        cursor = self.cursor()
+        self.assertEqual((cursor.done_count, cursor.next_position), (1, 0))
+        self.assertEqual(cursors._to_int(cursor.done), 0b10)
+        self.assertEqual(cursor.track_stamp, stamp)  # flipped in place, not rebuilt
+
+    def test_reorder_rebuilds_the_cursor(self):
+        self.mark(0, 1)
+        self.attach(3, 0, 1, 2)
+        self.assertNotEqual(self.cursor().track_stamp, Track.objects.get(pk=self.track.pk).updated_at)
+
+        result = self.suggest(limit=2)
+        self.assertEqual(result["completed"], 2)
+        self.assertEqual([s["id"] for s in result["upcoming"]], self.ids(3, 2))
+        cursor = self.cursor()
+        self.assertEqual(cursor.track_stamp, Track.objects.get(pk=self.track.pk).updated_at)
+        self.assertEqual(cursors._to_int(cursor.done), 0b110)
+
+    def test_detached_problem_drops_out_of_the_count(self):
+        self.mark(0, 1)
+        self.attach(1, 2, 3)
+        result = self.suggest()
+        self.assertEqual((result["completed"], result["total"]), (1, 3))
+        self.assertEqual(result["next"]["id"], self.problems[2].pk)
+
+    def test_extra_ids_merge_into_next_and_completed(self):
+        self.mark(1)
+        result = self.suggest(limit=2, extra=(0, 5))  # problem 5 isn't in the track
+        self.assertEqual(result["completed"], 2)
+        self.assertEqual(result["next"]["id"], self.problems[2].pk)
+        self.assertEqual([s["id"] for s in result["upcoming"]], self.ids(2, 3))
+        self.assertEqual(self.cursor().done_count, 1)  # not stored
+
+    def test_extra_ids_already_done_change_nothing(self):
+        self.mark(0)
+        self.assertEqual(self.suggest(extra=(0,)), self.suggest())
@@ -1,14 +1,25 @@
 from django.urls import path
 from .views import (
-  TrackListAPIView, TrackDetailAPIView, TrackCreateAPIView, TrackUpdateAPIView,SuggestNextAPIView, TrackBulkAttachAPIView
+  TrackListAPIView, TrackDetailAPIView, TrackProblemsAPIView, TrackCreateAPIView, TrackUpdateAPIView,SuggestNextAPIView, TrackBulkAttachAPIView,
+  ProgressAPIView, ProgressMarkAPIView, ProgressUnmarkAPIView, ProgressSummaryAPIView,
 )
 
 urlpatterns = [
     path('tracks/', TrackListAPIView.as_view(), name='track-list'),
     path('tracks/<int:pk>/', TrackDetailAPIView.as_view(), name='track-detail'),
+    path('tracks/<int:pk>/problems/', TrackProblemsAPIView.as_view(), name='track-problems'),
     path('tracks/create/', TrackCreateAPIView.as_view(), name='track-create'),
     path('tracks/<int:pk>/update/', TrackUpdateAPIView.as_view(), name='track-update'),
     path('tracks/<int:pk>/suggest-next/', SuggestNextAPIView.as_view(), name='track-suggest-next'),
     path('tracks/<int:pk>/attach/', TrackBulkAttachAPIView.as_view(), name='track-attach'),
+    # slug forms (after the int routes and tracks/create/, which they'd shadow)
+    path('tracks/<slug:slug>/', TrackDetailAPIView.as_view(), name='track-detail-slug'),
+    path('tracks/<slug:slug>/problems/', TrackProblemsAPIView.as_view(), name='track-problems-slug'),
+    path('tracks/<slug:slug>/suggest-next/', SuggestNextAPIView.as_view(), name='track-suggest-next-slug'),
+    path('tracks/<slug:slug>/attach/', TrackBulkAttachAPIView.as_view(), name='track-attach-slug'),
+    path('progress/', ProgressAPIView.as_view(), name='progress'),
+    path('progress/tracks/', ProgressSummaryAPIView.as_view(), name='progress-tracks'),
+    path('progress/mark/', ProgressMarkAPIView.as_view(), name='progress-mark'),
+    path('progress/unmark/', ProgressUnmarkAPIView.as_view(), name='progress-unmark'),
 
 ]
\ No newline at end of file
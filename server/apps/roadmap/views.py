@@ -2,24 +2,94 @@ from rest_framework import generics, permissions, status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from django.db.models import Prefetch
+from django.http import Http404
 
+from apps.problems.conditional import conditional_response
+from . import attach
+from . import catalogue
+from . import cursors
+from . import progress
+from . import slugs
 from .models import Track, TrackProblem
-from .serializers import TrackSerializer
+from .serializers import TrackSerializer, track_problem_page
 
 base_qs = Track.objects.prefetch_related(
     Prefetch('track_problems',
              queryset=TrackProblem.objects.select_related('problem').order_by('order'))
 )
 
+def track_pk(pk=None, slug=None) -> int:
+    """pk from either URL form (tracks/<pk>/... or tracks/<slug>/...); 404 for an unknown slug."""
+    if slug is None:
+        return pk
+    pk = slugs.resolve(slug)
+    if pk is None:
+        raise Http404
+    return pk
+
 class TrackListAPIView(generics.ListAPIView):
+    """
+    Served from pre-rendered JSON (catalogue.py); queryset/serializer kept for the schema.
+    ?view=summary -> cards only: [{id, name, description, slug, problem_count,
+                                   difficulty: {E, M, H}}]
+    """
     queryset = base_qs
     serializer_class = TrackSerializer
     pagination_class = None
 
+    def list(self, request, *args, **kwargs):
+        if request.query_params.get('view') == 'summary':
+            entry = catalogue.track_summary_list()
+        else:
+            entry = catalogue.track_list()
+        return conditional_response(
+            request, entry.response, etag=entry.etag, last_modified=entry.last_modified,
+        )
+
 class TrackDetailAPIView(generics.RetrieveAPIView):
     queryset = base_qs
     serializer_class = TrackSerializer
 
+    def retrieve(self, request, *args, **kwargs):
+        entry = catalogue.track_detail(track_pk(kwargs.get('pk'), kwargs.get('slug')))
+        if entry is None:
+            raise Http404
+        return conditional_response(
+            request, entry.response, etag=entry.etag, last_modified=entry.last_modified,
+        )
+
+class TrackProblemsAPIView(APIView):
+    """
+    GET /api/tracks/<pk or slug>/problems/?after=<cursor>&limit=<n>
+    -> { results: [{order, problem: {id, title, difficulty}}], next: <cursor> | null }
+
+    Keyset pagination on the (track, order) index; the cursor is
+    "<stored order>:<position>" of the last row returned (an unreadable one
+    starts from the top).
+    """
+    def get(self, request, pk=None, slug=None):
+        pk = track_pk(pk, slug)
+        try:
+            limit = max(1, min(200, int(request.query_params.get('limit', 50))))
+        except ValueError:
+            limit = 50
+        after_order, after_position = None, 0
+        cursor = request.query_params.get('after', '')
+        if cursor:
+            try:
+                after_order, after_position = (int(x) for x in cursor.split(':'))
+            except ValueError:
+                after_order, after_position = None, 0
+
+        page = track_problem_page(pk, after_order, after_position, limit + 1)
+        if not page and not Track.objects.filter(pk=pk).exists():
+            raise Http404
+        nxt = None
+        if len(page) > limit:
+            last_order, last = page[limit - 1]
+            nxt = f"{last_order}:{last['order']}"
+        return Response({"results": [item for _, item in page[:limit]], "next": nxt})
+
 class TrackCreateAPIView(generics.CreateAPIView):
     queryset = Track.objects.all()
     serializer_class = TrackSerializer
@@ -31,26 +101,95 @@ class TrackUpdateAPIView(generics.UpdateAPIView):
     permission_classes = [permissions.IsAdminUser]
 
 class TrackBulkAttachAPIView(APIView):
+    """
+    POST /api/tracks/<pk or slug>/attach/ { problem_ids: [...] }
+    Sets the track's problems to exactly this list, in this order (see attach.py).
+    """
     permission_classes = [permissions.IsAdminUser]
-    def post(self, request, pk):
+    def post(self, request, pk=None, slug=None):
+        pk = track_pk(pk, slug)
         ids = request.data.get("problem_ids", [])
-        TrackProblem.objects.filter(track_id=pk).delete()
-        TrackProblem.objects.bulk_create([
-            TrackProblem(track_id=pk, problem_id=pid, order=i+1)
-            for i, pid in enumerate(ids)
-        ])
-        return Response({"attached": len(ids)}, status=status.HTTP_201_CREATED)
+        if not isinstance(ids, list) or not all(type(i) is int for i in ids):
+            return Response({"error": "problem_ids must be a list of ints"},
+                            status=status.HTTP_400_BAD_REQUEST)
+        if len(set(ids)) != len(ids):
+            return Response({"error": "problem_ids contains duplicates"},
+                            status=status.HTTP_400_BAD_REQUEST)
+        unknown = sorted(set(ids) - set(progress.valid_problem_ids(ids)))
+        if unknown:
+            return Response({"error": "unknown problem ids", "detail": unknown[:50]},
+                            status=status.HTTP_400_BAD_REQUEST)
+        if not Track.objects.filter(pk=pk).exists():
+            raise Http404
+        return Response(attach.attach(pk, ids), status=status.HTTP_201_CREATED)
 
 class SuggestNextAPIView(APIView):
-    def get(self, request, pk):
+    """
+    GET /api/tracks/<pk or slug>/suggest-next/?limit=<n>
+    -> { next, upcoming: [next n], completed, total, percent }
+
+    Logged-in users: from their track cursor (see cursors.py), plus any
+    ?completed=1,2,3 the client still sends (not yet written through
+    /api/progress/mark/).
+    Anonymous: from ?completed= alone, as before.
+    """
+    def get(self, request, pk=None, slug=None):
+        pk = track_pk(pk, slug)
+        try:
+            limit = max(1, min(50, int(request.query_params.get('limit', 1))))
+        except ValueError:
+            limit = 1
         completed = request.query_params.get('completed', '')
         done_ids = {int(x) for x in completed.split(',') if x.isdigit()}
-        tp = (TrackProblem.objects
-              .filter(track_id=pk)
-              .exclude(problem_id__in=done_ids)
-              .select_related('problem')
-              .order_by('order')
-              .first())
-        if not tp:
-            return Response({"next": None})
-        return Response({"next": {"id": tp.problem_id, "title": tp.problem.title, "order": tp.order}})
+        if request.user.is_authenticated:
+            data = cursors.for_user(request.user, pk, limit, done_ids)
+        else:
+            data = cursors.for_ids(done_ids, pk, limit)
+        return Response(data or {"next": None})
+
+MAX_BULK_IDS = 5000
+
+class ProgressAPIView(APIView):
+    """GET /api/progress/?track=<pk> -> { completed: [problem ids] } for the current user."""
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        track = request.query_params.get('track')
+        track_id = int(track) if track and track.isdigit() else None
+        return Response({"completed": progress.completed_ids(request.user, track_id)})
+
+class ProgressSummaryAPIView(APIView):
+    """GET /api/progress/tracks/ -> { tracks: [{id, completed, total, percent}] } for the current user."""
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        return Response({"tracks": progress.track_summary(request.user)})
+
+class _ProgressWriteAPIView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+    result_key = None
+
+    def apply(self, user, ids):
+        raise NotImplementedError
+
+    def post(self, request):
+        ids = request.data.get("problem_ids") if isinstance(request.data, dict) else None
+        if (not isinstance(ids, list) or len(ids) > MAX_BULK_IDS
+                or not all(type(i) is int for i in ids)):
+            return Response({"error": f"problem_ids must be a list of at most {MAX_BULK_IDS} ints"},
+                            status=status.HTTP_400_BAD_REQUEST)
+        return Response({self.result_key: self.apply(request.user, ids)})
+
+class ProgressMarkAPIView(_ProgressWriteAPIView):
+    """POST /api/progress/mark/ { problem_ids: [...] } -> { marked: <newly completed> }"""
+    result_key = "marked"
+
+    def apply(self, user, ids):
+        return progress.mark(user, ids)
+
+class ProgressUnmarkAPIView(_ProgressWriteAPIView):
+    """POST /api/progress/unmark/ { problem_ids: [...] } -> { unmarked: <removed> }"""
+    result_key = "unmarked"
+
+    def apply(self, user, ids):
+        return progress.unmark(user, ids)
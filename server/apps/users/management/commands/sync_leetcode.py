@@ -0,0 +1,56 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from apps.users.sync import due_profiles, sync_profiles
+
+
+class Command(BaseCommand):
+    help = ("Refresh stale Profile LeetCode stats in batches until none are due; "
+            "with --loop keep running as a background worker")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int,
+                            default=getattr(settings, "LEETCODE_SYNC_BATCH_SIZE", 100))
+        parser.add_argument("--loop", action="store_true",
+                            help="keep running; sleep when nothing is due")
+        parser.add_argument("--min-interval", type=float,
+                            default=getattr(settings, "LEETCODE_SYNC_MIN_INTERVAL", 2.0),
+                            help="seconds between batches (rate limit)")
+        parser.add_argument("--idle-sleep", type=float,
+                            default=getattr(settings, "LEETCODE_SYNC_IDLE_SLEEP", 30.0),
+                            help="seconds to sleep when no profile is stale")
+        parser.add_argument("--retry-after", type=float, default=300.0,
+                            help="seconds before retrying a profile whose fetch failed")
+
+    def handle(self, *args, **opts):
+        backoff = {}  # profile id -> monotonic time it may be retried
+        total = 0
+
+        while True:
+            started = time.monotonic()
+            backoff = {pk: t for pk, t in backoff.items() if t > started}
+            close_old_connections()
+
+            batch = due_profiles(opts["batch_size"], exclude_ids=backoff)
+            if batch:
+                res = sync_profiles(batch)
+                for pk in res["failed"]:
+                    backoff[pk] = started + opts["retry_after"]
+                total += res["updated"]
+                self.stdout.write(
+                    f"synced {res['updated']} (not found {res['not_found']}, "
+                    f"failed {len(res['failed'])})"
+                )
+
+            if not batch:
+                if not opts["loop"]:
+                    break
+                time.sleep(opts["idle_sleep"])
+                continue
+            # rate limit: at most one batch per --min-interval seconds
+            time.sleep(max(0.0, opts["min_interval"] - (time.monotonic() - started)))
+
+        self.stdout.write(self.style.SUCCESS(f"Synced {total} profiles"))
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2026-10-18 17:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="profile",
+            name="ranking",
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="profile",
+            name="last_sync_at",
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+    ]
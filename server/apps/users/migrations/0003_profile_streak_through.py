@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-18 17:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0002_profile_ranking_sync_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="profile",
+            name="streak_through",
+            field=models.DateField(blank=True, null=True),
+        ),
+    ]
@@ -49,10 +49,13 @@ class Profile(models.Model):
     easy_solved   = models.PositiveIntegerField(default=0)
     medium_solved = models.PositiveIntegerField(default=0)
     hard_solved   = models.PositiveIntegerField(default=0)
-    streak_days   = models.PositiveIntegerField(default=0)
+    streak_days   = models.PositiveIntegerField(default=0)    # latest run of active days ...
+    streak_through = models.DateField(null=True, blank=True)  # ... ending here (current only if today)
+    ranking       = models.PositiveIntegerField(null=True, blank=True)  # LeetCode global rank
 
     # When did we last pull data from LeetCode?
-    last_sync_at = models.DateTimeField(null=True, blank=True)
+    # (indexed: the sync worker looks for the stalest rows, see apps/users/sync.py)
+    last_sync_at = models.DateTimeField(null=True, blank=True, db_index=True)
 
     def __str__(self):
         # This is what appears in admin lists
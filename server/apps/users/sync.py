@@ -0,0 +1,122 @@
+# apps/users/sync.py
+#
+# Copies LeetCode stats into Profile rows so reads don't have to go to LeetCode.
+#
+# Used by:  python manage.py sync_leetcode [--loop]
+#
+# Which profiles get refreshed first?
+#   1) only profiles with a leetcode_username that are stale
+#      (never synced, or last_sync_at older than LEETCODE_PROFILE_FRESH_SECONDS)
+#   2) "active" users (logged in within LEETCODE_SYNC_ACTIVE_DAYS) before the rest
+#   3) never-synced, then oldest sync first
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Case, F, IntegerField, Q, Value, When
+from django.utils import timezone
+
+from apps.leaderboard import ranking
+from apps.problems import views as leetcode  # module import: problems.views imports us too
+from .models import Profile
+
+SYNC_FIELDS = ["ranking", "total_solved", "easy_solved", "medium_solved", "hard_solved", "last_sync_at"]
+
+
+def fresh_seconds() -> int:
+    return getattr(settings, "LEETCODE_PROFILE_FRESH_SECONDS", 900)
+
+
+def due_profiles(limit: int, exclude_ids=(), now=None):
+    """The `limit` profiles that most need a refresh, best candidates first."""
+    now = now or timezone.now()
+    stale_before = now - timedelta(seconds=fresh_seconds())
+    active_since = now - timedelta(days=getattr(settings, "LEETCODE_SYNC_ACTIVE_DAYS", 7))
+    qs = (
+        Profile.objects
+        .exclude(leetcode_username__isnull=True)
+        .exclude(leetcode_username="")
+        .exclude(pk__in=list(exclude_ids))
+        .filter(Q(last_sync_at__isnull=True) | Q(last_sync_at__lt=stale_before))
+        .annotate(inactive=Case(
+            When(user__last_login__gte=active_since, then=Value(0)),
+            default=Value(1),
+            output_field=IntegerField(),
+        ))
+        .select_related("user")
+        .order_by("inactive", F("last_sync_at").asc(nulls_first=True), "pk")
+    )
+    return list(qs[:limit])
+
+
+def sync_profiles(profiles) -> dict:
+    """
+    Fetch stats for `profiles` (batched upstream, cache bypassed) and save them
+    with one bulk_update, then move them on the leaderboard. Not-found usernames are zeroed (ranking=None) and
+    marked synced so they aren't retried every pass; fetch failures are left
+    untouched.
+
+    Returns {"updated": n, "not_found": n, "failed": [profile ids]}.
+    """
+    by_name = {}
+    for p in profiles:
+        by_name.setdefault(p.leetcode_username.strip(), []).append(p)
+
+    results = leetcode.fetch_leetcode_stats_many(list(by_name), use_cache=False)
+    now = timezone.now()
+    changed, failed, not_found = [], [], 0
+
+    for name, rows in by_name.items():
+        stats = results.get(name)
+        if isinstance(stats, Exception):
+            failed.extend(p.pk for p in rows)
+            continue
+        if stats is None:
+            not_found += len(rows)
+            stats = {}
+        for p in rows:
+            p.ranking = stats.get("ranking")
+            p.total_solved = stats.get("totalSolved", 0)
+            p.easy_solved = stats.get("easy", 0)
+            p.medium_solved = stats.get("medium", 0)
+            p.hard_solved = stats.get("hard", 0)
+            p.last_sync_at = now
+            changed.append(p)
+
+    if changed:
+        Profile.objects.bulk_update(changed, SYNC_FIELDS, batch_size=500)
+        ranking.place_profiles(changed)
+    return {"updated": len(changed), "not_found": not_found, "failed": failed}
+
+
+def fresh_profile(username: str, stale_ok: bool = False):
+    """
+    The recently synced Profile for <username>, or None if there isn't one.
+    stale_ok=True accepts a sync of any age (used while LeetCode is unreachable).
+
+    Exact match on leetcode_username so the index is used; other spellings
+    simply fall through to the live/cached path. Rows synced as "not found"
+    (ranking is None) fall through too, so the live path can answer 404.
+    """
+    qs = Profile.objects.filter(leetcode_username=username, ranking__isnull=False)
+    if not stale_ok:
+        qs = qs.filter(last_sync_at__gte=timezone.now() - timedelta(seconds=fresh_seconds()))
+    return (
+        qs
+        .only("leetcode_username", *SYNC_FIELDS)
+        .order_by("-last_sync_at")
+        .first()
+    )
+
+
+def profile_stats(p: Profile) -> dict:
+    """Stats dict in the same shape as the live endpoint."""
+    return {
+        "username": p.leetcode_username,
+        "ranking": p.ranking,
+        "totalSolved": p.total_solved,
+        "easy": p.easy_solved,
+        "medium": p.medium_solved,
+        "hard": p.hard_solved,
+    }
+
@@ -0,0 +1,76 @@
+"""
+Microbenchmark: streak engine (apps/problems/streaks.py) vs the old
+day-by-day walk it replaced.
+
+    python bench_streaks.py [years] [active_ratio]
+"""
+
+import random
+import sys
+import timeit
+from datetime import datetime, timedelta, timezone
+
+from apps.problems.streaks import streaks_from_days
+
+
+def legacy_calc_streaks_from_days(day_counts: dict) -> tuple[int, int]:
+    """The original views._calc_streaks_from_days, kept here for comparison."""
+    if not day_counts:
+        return 0, 0
+
+    today = datetime.now(timezone.utc).date()
+    start = min(datetime.fromisoformat(d).date() for d in day_counts.keys())
+
+    cur = 0
+    mx = 0
+    d = start
+    while d <= today:
+        ds = d.isoformat()
+        if day_counts.get(ds, 0) > 0:
+            cur += 1
+            mx = max(mx, cur)
+        else:
+            cur = 0
+        d += timedelta(days=1)
+
+    cur_streak = 0
+    d = today
+    while day_counts.get(d.isoformat(), 0) > 0:
+        cur_streak += 1
+        d -= timedelta(days=1)
+
+    return cur_streak, mx
+
+
+def make_history(years: int, active_ratio: float) -> dict:
+    rnd = random.Random(42)
+    today = datetime.now(timezone.utc).date()
+    days = {}
+    for i in range(years * 365):
+        if i < 30 or rnd.random() < active_ratio:  # last 30 days active -> non-zero current streak
+            days[(today - timedelta(days=i)).isoformat()] = rnd.randint(1, 5)
+    return days
+
+
+def main():
+    years = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    ratio = float(sys.argv[2]) if len(sys.argv) > 2 else 0.3
+    days = make_history(years, ratio)
+    today = datetime.now(timezone.utc).date()
+    as_dates = {datetime.fromisoformat(k).date(): v for k, v in days.items()}
+
+    assert legacy_calc_streaks_from_days(days) == streaks_from_days(days, today)
+
+    n = 200
+    for label, fn in (
+        ("legacy walk      ", lambda: legacy_calc_streaks_from_days(days)),
+        ("streaks (iso str)", lambda: streaks_from_days(days, today)),
+        ("streaks (date)   ", lambda: streaks_from_days(as_dates, today)),
+    ):
+        t = min(timeit.repeat(fn, number=n, repeat=5)) / n
+        print(f"{label}: {t * 1e6:9.1f} us/call")
+    print(f"{years} years, {len(days)} active days, streaks={streaks_from_days(days, today)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark: track output via the DRF serializers (TrackSerializer ->
+TrackProblemSerializer -> ProblemSerializer + JSONRenderer) vs the values()
+fast path in apps/roadmap/serializers.py (track_dicts + render_json).
+
+Builds a throwaway sqlite DB with one track of N problems, checks both paths
+produce the same JSON, then times query + serialization + rendering.
+
+    python bench_tracks.py [problems=1000] [repeat=20]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import timeit
+
+import django
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    tmp = tempfile.mkdtemp()
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmp, 'bench.sqlite3')}"
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    django.setup()
+
+    from django.core.management import call_command
+    from rest_framework.renderers import JSONRenderer
+
+    from apps.problems.models import Problem
+    from apps.roadmap import serializers as ser
+    from apps.roadmap.models import Track, TrackProblem
+    from apps.roadmap.views import base_qs
+
+    call_command("migrate", verbosity=0)
+    track = Track.objects.create(name="Bench", description="benchmark track")
+    problems = Problem.objects.bulk_create(
+        Problem(title=f"Bench problem {i}", difficulty="EMH"[i % 3]) for i in range(n)
+    )
+    TrackProblem.objects.bulk_create(
+        TrackProblem(track=track, problem=p, order=i + 1) for i, p in enumerate(problems)
+    )
+    qs = Track.objects.filter(pk=track.pk)
+
+    def drf():
+        return JSONRenderer().render(ser.TrackSerializer(base_qs.filter(pk=track.pk), many=True).data)
+
+    def fast():
+        return ser.render_json(ser.track_dicts(qs))
+
+    def fast_stdlib():
+        orjson, ser.orjson = ser.orjson, None
+        try:
+            return fast()
+        finally:
+            ser.orjson = orjson
+
+    assert json.loads(drf()) == json.loads(fast()) == json.loads(fast_stdlib())
+
+    print(f"1 track x {n} problems, best of {repeat}")
+    base = None
+    cases = [("drf serializers", drf), ("values() + stdlib json", fast_stdlib)]
+    if ser.orjson is not None:
+        cases.append(("values() + orjson", fast))
+    for label, fn in cases:
+        best = min(timeit.repeat(fn, number=1, repeat=repeat))
+        base = base or best
+        print(f"  {label:24s} {best * 1000:8.2f} ms  ({base / best:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,3 +14,12 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
 application = get_asgi_application()
+
+from django.conf import settings  # noqa: E402  (settings are configured now)
+
+if settings.LEETCODE_ASYNC_VIEWS:
+    # WhiteNoise is dropped from MIDDLEWARE in this mode (see settings.py),
+    # so serve static files (admin assets) at the ASGI layer instead.
+    from django.contrib.staticfiles.handlers import ASGIStaticFilesHandler
+
+    application = ASGIStaticFilesHandler(application)
@@ -102,6 +102,83 @@ DATABASES = {
     )
 }
 
+# --- Caches: locmem by default so dev/offline works; point at redis/db in prod ---
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "default",
+    },
+    # LeetCode upstream responses (see apps/problems/cache.py)
+    "leetcode": {
+        "BACKEND": os.getenv(
+            "LEETCODE_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.getenv("LEETCODE_CACHE_LOCATION", "leetcode"),
+    },
+    # pre-rendered track JSON (see apps/roadmap/catalogue.py); share it between
+    # workers in prod so a write is seen everywhere at once
+    "roadmap": {
+        "BACKEND": os.getenv(
+            "ROADMAP_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.getenv("ROADMAP_CACHE_LOCATION", "roadmap"),
+    },
+}
+ROADMAP_CACHE_ALIAS = "roadmap"
+ROADMAP_CACHE_TTL = int(os.getenv("ROADMAP_CACHE_TTL", "300"))  # old versions / unshared caches
+ROADMAP_SLUG_RECHECK = float(os.getenv("ROADMAP_SLUG_RECHECK", "5"))  # s between slug map version checks
+
+# --- Problem search (see apps/problems/search.py) ---
+PROBLEM_SEARCH_BACKEND = os.getenv("PROBLEM_SEARCH_BACKEND", "memory")  # or "db"
+PROBLEM_SEARCH_CACHE_ALIAS = "default"  # holds the index version; share it in prod
+PROBLEM_SEARCH_MAX_AGE = int(os.getenv("PROBLEM_SEARCH_MAX_AGE", "300"))  # rebuild backstop (s)
+PROBLEM_SEARCH_RECHECK = float(os.getenv("PROBLEM_SEARCH_RECHECK", "5"))  # s between version checks
+LEETCODE_CACHE_ALIAS = "leetcode"
+LEETCODE_CACHE_TTL = int(os.getenv("LEETCODE_CACHE_TTL", "300"))               # fresh window (s)
+LEETCODE_CACHE_STALE_TTL = int(os.getenv("LEETCODE_CACHE_STALE_TTL", "3600"))  # serve stale + refresh
+LEETCODE_CACHE_NEGATIVE_TTL = int(os.getenv("LEETCODE_CACHE_NEGATIVE_TTL", "60"))  # not_found
+
+# --- LeetCode upstream HTTP client (see apps/problems/upstream.py) ---
+LEETCODE_BASE_URL = os.getenv("LEETCODE_BASE_URL", "https://leetcode.com")  # stub server in tests
+LEETCODE_HTTP_POOL_CONNECTIONS = int(os.getenv("LEETCODE_HTTP_POOL_CONNECTIONS", "4"))  # hosts
+LEETCODE_HTTP_POOL_MAXSIZE = int(os.getenv("LEETCODE_HTTP_POOL_MAXSIZE", "16"))         # per host
+LEETCODE_HTTP_CONNECT_TIMEOUT = float(os.getenv("LEETCODE_HTTP_CONNECT_TIMEOUT", "3.05"))
+LEETCODE_HTTP_READ_TIMEOUT = float(os.getenv("LEETCODE_HTTP_READ_TIMEOUT", "10"))
+LEETCODE_HTTP_RETRIES = int(os.getenv("LEETCODE_HTTP_RETRIES", "2"))
+LEETCODE_HTTP_BACKOFF = float(os.getenv("LEETCODE_HTTP_BACKOFF", "0.3"))
+LEETCODE_HTTP_BACKOFF_MAX = float(os.getenv("LEETCODE_HTTP_BACKOFF_MAX", "2"))  # caps Retry-After too
+LEETCODE_FETCH_WORKERS = int(os.getenv("LEETCODE_FETCH_WORKERS", "8"))  # fan-out thread pool
+LEETCODE_CALENDAR_DEADLINE = float(os.getenv("LEETCODE_CALENDAR_DEADLINE", "12"))  # whole calendar fetch
+LEETCODE_CALENDAR_SPECULATIVE_REST = os.getenv("LEETCODE_CALENDAR_SPECULATIVE_REST", "False") == "True"
+LEETCODE_CALENDAR_FRESH_SECONDS = int(os.getenv("LEETCODE_CALENDAR_FRESH_SECONDS", "300"))  # stored days
+LEETCODE_CALENDAR_DAYS = int(os.getenv("LEETCODE_CALENDAR_DAYS", "181"))  # default calendar window
+LEETCODE_CALENDAR_MAX_DAYS = int(os.getenv("LEETCODE_CALENDAR_MAX_DAYS", "3660"))  # largest ?days=
+LEETCODE_RESPONSE_MAX_AGE = int(os.getenv("LEETCODE_RESPONSE_MAX_AGE", "60"))  # Cache-Control for clients
+LEETCODE_BATCH_CHUNK = int(os.getenv("LEETCODE_BATCH_CHUNK", "50"))  # users per aliased GraphQL query
+LEETCODE_BATCH_MAX = int(os.getenv("LEETCODE_BATCH_MAX", "500"))      # users per batch API call
+LEETCODE_BREAKER_FAILURES = int(os.getenv("LEETCODE_BREAKER_FAILURES", "5"))  # failures that open it
+LEETCODE_BREAKER_WINDOW = float(os.getenv("LEETCODE_BREAKER_WINDOW", "30"))   # ... within this many s
+LEETCODE_BREAKER_RESET = float(os.getenv("LEETCODE_BREAKER_RESET", "30"))     # open -> half-open probe
+LEETCODE_RATE_LIMIT = float(os.getenv("LEETCODE_RATE_LIMIT", "20"))  # outbound calls/s (0 = unlimited)
+LEETCODE_RATE_BURST = int(os.getenv("LEETCODE_RATE_BURST", "40"))
+
+# Async LeetCode views (apps/problems/async_views.py); only useful when served via config.asgi
+LEETCODE_ASYNC_VIEWS = os.getenv("LEETCODE_ASYNC_VIEWS", "False") == "True"
+LEETCODE_ASYNC_MAX_CONNECTIONS = int(os.getenv("LEETCODE_ASYNC_MAX_CONNECTIONS", "100"))
+LEETCODE_ASYNC_MAX_KEEPALIVE = int(os.getenv("LEETCODE_ASYNC_MAX_KEEPALIVE", "20"))
+if LEETCODE_ASYNC_VIEWS:
+    # WhiteNoise's middleware is sync-only: Django would run every async view
+    # through the sync thread and lose the concurrency. config/asgi.py serves
+    # static files itself in this mode.
+    MIDDLEWARE.remove("whitenoise.middleware.WhiteNoiseMiddleware")
+
+# --- Profile sync worker: python manage.py sync_leetcode --loop (see apps/users/sync.py) ---
+LEETCODE_PROFILE_FRESH_SECONDS = int(os.getenv("LEETCODE_PROFILE_FRESH_SECONDS", "900"))  # serve from DB
+LEETCODE_SYNC_BATCH_SIZE = int(os.getenv("LEETCODE_SYNC_BATCH_SIZE", "100"))
+LEETCODE_SYNC_MIN_INTERVAL = float(os.getenv("LEETCODE_SYNC_MIN_INTERVAL", "2"))  # s between batches
+LEETCODE_SYNC_IDLE_SLEEP = float(os.getenv("LEETCODE_SYNC_IDLE_SLEEP", "30"))
+LEETCODE_SYNC_ACTIVE_DAYS = int(os.getenv("LEETCODE_SYNC_ACTIVE_DAYS", "7"))  # prioritised users
+
 # --- CORS: allow local dev; add your deployed frontend later ---
 CORS_ALLOW_ALL_ORIGINS = True
 CORS_ALLOWED_ORIGINS = [
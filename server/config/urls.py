@@ -8,4 +8,5 @@ urlpatterns = [
     path("api/",include('apps.roadmap.urls')),
     path("api/users/", include("apps.users.urls")),
      path("api/problems/", include("apps.problems.urls")),
+    path("api/leaderboard/", include("apps.leaderboard.urls")),
 ]
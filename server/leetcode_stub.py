@@ -0,0 +1,194 @@
+"""
+Local stand-in for the bits of leetcode.com we call.
+
+Usable from tests:
+
+    with StubLeetCode(latency=0.05) as stub:
+        settings.LEETCODE_BASE_URL = stub.url
+        ...
+        stub.connections, stub.requests
+
+or from the shell, to measure what connection pooling saves:
+
+    python leetcode_stub.py bench [n_requests]
+"""
+
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# one submission per day for the last ~400 days
+_NOW = int(time.time()) // 86400 * 86400
+CALENDAR = {str(_NOW - i * 86400): (i % 5) + 1 for i in range(400)}
+
+
+def stats_for(username: str) -> dict:
+    n = sum(map(ord, username)) % 500
+    return {
+        "username": username,
+        "profile": {"ranking": 1000 + n},
+        "submitStats": {"acSubmissionNum": [
+            {"difficulty": "All", "count": n * 3},
+            {"difficulty": "Easy", "count": n},
+            {"difficulty": "Medium", "count": n},
+            {"difficulty": "Hard", "count": n},
+        ]},
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    disable_nagle_algorithm = True  # headers and body go out in separate writes
+
+    def setup(self):
+        super().setup()
+        self.server.stub._count("connections")
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status: int, payload) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _graphql(self, doc: dict):
+        query = doc.get("query") or ""
+        variables = doc.get("variables") or {}
+        username = variables.get("username") or ""
+        if "batchStats" in query:  # aliased: u0: matchedUser(username: $u0) ...
+            missing = self.server.stub.missing
+            return {"data": {
+                alias: None if name in missing else stats_for(name)
+                for alias, name in variables.items()
+            }}
+        if username in self.server.stub.missing:
+            return {"data": {"matchedUser": None, "userCalendar": None}}
+        if "userCalendar" in query:
+            return {"data": {"userCalendar": {"submissionCalendar": json.dumps(CALENDAR)}}}
+        return {"data": {"matchedUser": stats_for(username)}}
+
+    def do_POST(self):
+        stub = self.server.stub
+        stub._count("requests")
+        length = int(self.headers.get("Content-Length") or 0)
+        doc = json.loads(self.rfile.read(length) or b"{}")
+        time.sleep(stub.latency)
+        if stub.fail_status:
+            return self._send(stub.fail_status, {"error": "stub"})
+        self._send(200, self._graphql(doc))
+
+    def do_GET(self):
+        stub = self.server.stub
+        stub._count("requests")
+        time.sleep(stub.latency)
+        if stub.fail_status:
+            return self._send(stub.fail_status, {"error": "stub"})
+        url = urlparse(self.path)
+        if url.path.startswith("/api/user_submission_calendar"):
+            username = url.path.rstrip("/").rsplit("/", 1)[-1]
+            if url.path.startswith("/api/user_submission_calendar/"):
+                username = (parse_qs(url.query).get("username") or [""])[0]
+            if username in stub.missing:
+                return self._send(404, {})
+            return self._send(200, json.dumps(CALENDAR))
+        self._send(404, {})
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256  # listen backlog; the default of 5 drops bursts
+
+
+class StubLeetCode:
+    def __init__(self, latency: float = 0.0, host: str = "127.0.0.1", port: int = 0):
+        self.latency = latency
+        self.fail_status = 0      # set to e.g. 503 to simulate an outage
+        self.missing = set()      # usernames that "don't exist"
+        self.connections = 0
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server = _Server((host, port), _Handler)
+        self._server.stub = self
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _count(self, attr: str) -> None:
+        with self._lock:
+            setattr(self, attr, getattr(self, attr) + 1)
+
+    def reset_counts(self) -> None:
+        with self._lock:
+            self.connections = 0
+            self.requests = 0
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def _bench(n: int) -> None:
+    import os
+
+    import django
+    import requests
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    django.setup()
+    from django.conf import settings
+
+    from apps.problems import upstream
+
+    with StubLeetCode() as stub:
+        settings.LEETCODE_BASE_URL = stub.url
+        body = {"query": "query userProfile { matchedUser }", "variables": {"username": "alice"}}
+
+        t0 = time.perf_counter()
+        for _ in range(n):
+            requests.post(upstream.graphql_url(), json=body, timeout=5).raise_for_status()
+        plain = time.perf_counter() - t0
+        plain_conns = stub.connections
+
+        stub.reset_counts()
+        upstream.reset()
+        t0 = time.perf_counter()
+        for _ in range(n):
+            upstream.post(upstream.graphql_url(), json=body).raise_for_status()
+        pooled = time.perf_counter() - t0
+
+        print(f"requests.post  : {n} requests, {plain_conns} connections, {plain * 1000 / n:.2f} ms/req")
+        print(f"upstream.post  : {n} requests, {stub.connections} connections, {pooled * 1000 / n:.2f} ms/req")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "bench":
+        _bench(int(sys.argv[2]) if len(sys.argv) > 2 else 200)
+    else:
+        with StubLeetCode(port=8765) as s:
+            print(f"stub LeetCode listening on {s.url} (Ctrl+C to stop)")
+            try:
+                while True:
+                    time.sleep(3600)
+            except KeyboardInterrupt:
+                pass
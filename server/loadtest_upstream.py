@@ -0,0 +1,131 @@
+"""
+WSGI vs ASGI throughput for the LeetCode proxy views against a slow local stub.
+
+Starts leetcode_stub.StubLeetCode with a fixed latency, then for each mode
+boots the app in a subprocess, fires concurrent GETs at
+/api/problems/leetcode/<unique user>/ (cache disabled, so every request goes
+upstream) and reports throughput and latency.
+
+    python loadtest_upstream.py [--latency 0.5] [--requests 400] [--concurrency 200]
+                                [--threads 8] [--modes wsgi,asgi]
+
+  wsgi: gunicorn config.wsgi, 1 worker x --threads threads, sync views
+  asgi: uvicorn config.asgi, 1 worker, LEETCODE_ASYNC_VIEWS=True
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+from leetcode_stub import StubLeetCode
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _server_cmd(mode: str, port: int, threads: int) -> list:
+    if mode == "wsgi":
+        return [sys.executable, "-m", "gunicorn", "config.wsgi:application",
+                "-b", f"127.0.0.1:{port}", "-w", "1", "--threads", str(threads), "--timeout", "120"]
+    return [sys.executable, "-m", "uvicorn", "config.asgi:application",
+            "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"]
+
+
+def _wait_ready(port: int, proc, timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError("server exited during startup")
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/api/users/ping/", timeout=1)
+            return
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    raise RuntimeError("server did not start")
+
+
+async def _fire(port: int, n: int, concurrency: int, tag: str) -> tuple:
+    sem = asyncio.Semaphore(concurrency)
+    latencies, errors = [], 0
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits, timeout=120) as client:
+        async def one(i):
+            nonlocal errors
+            async with sem:
+                t0 = time.perf_counter()
+                try:
+                    r = await client.get(f"http://127.0.0.1:{port}/api/problems/leetcode/{tag}{i}/")
+                    if r.status_code != 200:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append(time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(n)))
+        return time.perf_counter() - t0, latencies, errors
+
+
+def run_mode(mode: str, args, stub: StubLeetCode, db_url: str) -> None:
+    port = _free_port()
+    env = dict(
+        os.environ,
+        DJANGO_SETTINGS_MODULE="config.settings",
+        DATABASE_URL=db_url,
+        LEETCODE_BASE_URL=stub.url,
+        LEETCODE_CACHE_BACKEND="django.core.cache.backends.dummy.DummyCache",
+        LEETCODE_HTTP_POOL_MAXSIZE=str(max(args.threads, 16)),
+        LEETCODE_ASYNC_MAX_CONNECTIONS=str(args.concurrency),
+        LEETCODE_ASYNC_VIEWS="True" if mode == "asgi" else "False",
+        LEETCODE_RATE_LIMIT="0",  # measure throughput, not the outbound rate budget's 503s
+    )
+    proc = subprocess.Popen(_server_cmd(mode, port, args.threads), cwd=HERE, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        _wait_ready(port, proc)
+        stub.reset_counts()
+        elapsed, lat, errors = asyncio.run(_fire(port, args.requests, args.concurrency, f"{mode}u"))
+        lat.sort()
+        print(f"{mode}: {args.requests / elapsed:7.1f} req/s  "
+              f"p50 {statistics.median(lat) * 1000:7.0f} ms  "
+              f"p99 {lat[int(len(lat) * 0.99) - 1] * 1000:7.0f} ms  "
+              f"errors {errors}  upstream requests {stub.requests}")
+    finally:
+        proc.terminate()
+        proc.wait(10)
+
+
+def main():
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--latency", type=float, default=0.5, help="stub upstream latency (s)")
+    p.add_argument("--requests", type=int, default=400)
+    p.add_argument("--concurrency", type=int, default=200)
+    p.add_argument("--threads", type=int, default=8, help="gunicorn threads for wsgi")
+    p.add_argument("--modes", default="wsgi,asgi")
+    args = p.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_url = f"sqlite:///{os.path.join(tmp, 'loadtest.sqlite3')}"
+        subprocess.run([sys.executable, "manage.py", "migrate", "-v0"], cwd=HERE, check=True,
+                       env=dict(os.environ, DATABASE_URL=db_url))
+        with StubLeetCode(latency=args.latency) as stub:
+            print(f"stub latency {args.latency}s, {args.requests} requests, concurrency {args.concurrency}")
+            for mode in args.modes.split(","):
+                run_mode(mode.strip(), args, stub, db_url)
+
+
+if __name__ == "__main__":
+    main()